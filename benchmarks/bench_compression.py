@@ -0,0 +1,36 @@
+import os
+import tempfile
+
+from rstcloth import RstCloth
+from .bench_documents import write_document
+
+
+class TimeCompressedOutput:
+    """A 10 MB document compressed as it is written."""
+
+    params = ["gz", "bz2", "xz"]
+    param_names = ["suffix"]
+    timeout = 300
+
+    def setup(self, suffix):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "page.rst." + suffix)
+
+    def teardown(self, suffix):
+        self.directory.cleanup()
+
+    def time_write(self, suffix):
+        with RstCloth.open(self.path) as r:
+            write_document(r, 10 * 1024 * 1024)
+
+    def peakmem_write(self, suffix):
+        with RstCloth.open(self.path) as r:
+            write_document(r, 10 * 1024 * 1024)
+
+    def track_compression_ratio(self, suffix):
+        with RstCloth.open(self.path) as r:
+            write_document(r, 10 * 1024 * 1024)
+            size = r.mark()
+        return size / os.stat(self.path).st_size
+
+    track_compression_ratio.unit = "ratio"
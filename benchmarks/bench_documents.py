@@ -0,0 +1,115 @@
+import time
+
+from rstcloth import RstCloth
+
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
+
+# Size of the output of one call to write_section(), measured once so that
+# documents can be generated at a target size.
+_section_size = None
+
+
+def write_section(r, index):
+    """Writes one section of mixed headings, paragraphs, lists, tables and code blocks."""
+    text = " ".join(WORDS[(index + i) % len(WORDS)] for i in range(120))
+    r.h2("Section {0}".format(index))
+    r.content(text)
+    r.newline()
+    for item in range(5):
+        r.li("item {0} {1}".format(item, text[:100]))
+    r.newline()
+    r.note(content=text, fields=[("class", "tip")])
+    r.newline()
+    descriptions = [text[start:end] for start, end in zip(range(0, 100, 10), range(40, 140, 10))]
+    r.table(
+        ["name", "type", "description"],
+        [["name{0}".format(row), "str", description] for row, description in enumerate(descriptions)],
+    )
+    r.codeblock(["def f{0}(x):".format(index), "    return x * {0}".format(index)] * 5, language="python")
+    r.newline()
+    r.definition("term {0}".format(index), text[:200])
+    r.field("Version", "1.{0}".format(index))
+    r.newline()
+
+
+def write_document(r, size):
+    """Writes a synthetic document of about size characters."""
+    global _section_size
+    if _section_size is None:
+        sample = RstCloth(stream=None)
+        write_section(sample, 0)
+        _section_size = len(sample.data)
+    r.title("Synthetic document")
+    for index in range(max(size // _section_size, 1)):
+        write_section(r, index)
+    r.flush()
+
+
+class TimeDocument:
+    """Full synthetic documents of 1 MB and 10 MB."""
+
+    params = [1, 10]
+    param_names = ["megabytes"]
+    timeout = 300
+
+    def time_render(self, megabytes):
+        write_document(RstCloth(stream=None), megabytes * 1024 * 1024)
+
+    def time_render_buffered(self, megabytes):
+        write_document(RstCloth(stream=None, buffer_size=65536), megabytes * 1024 * 1024)
+
+    def time_render_cached(self, megabytes):
+        write_document(RstCloth(stream=None, cache_size=1024), megabytes * 1024 * 1024)
+
+    def track_lines_per_second(self, megabytes):
+        r = RstCloth(stream=None)
+        start = time.perf_counter()
+        write_document(r, megabytes * 1024 * 1024)
+        seconds = time.perf_counter() - start
+        return r.data.count("\n") / seconds
+
+    track_lines_per_second.unit = "lines/s"
+
+    def peakmem_render(self, megabytes):
+        write_document(RstCloth(stream=None), megabytes * 1024 * 1024)
+
+    def peakmem_render_to_data(self, megabytes):
+        r = RstCloth(stream=None)
+        write_document(r, megabytes * 1024 * 1024)
+        r.data
+
+
+class TimeNesting:
+    """Sections nested three directives deep, rendered apart and passed back in, or written within blocks."""
+
+    params = [1, 10]
+    param_names = ["megabytes"]
+    timeout = 300
+
+    def _nest_rendered(self, r, size, depth):
+        if depth == 0:
+            write_document(r, size)
+            return
+        inner = RstCloth(stream=None, line_width=r._line_width - 3)
+        self._nest_rendered(inner, size, depth - 1)
+        r.directive("note", content=inner.data.splitlines())
+
+    def _nest_blocks(self, r, size, depth):
+        if depth == 0:
+            write_document(r, size)
+            return
+        with r.directive_block("note"):
+            self._nest_blocks(r, size, depth - 1)
+
+    def time_rendered_content(self, megabytes):
+        self._nest_rendered(RstCloth(stream=None), megabytes * 1024 * 1024, 3)
+
+    def time_blocks(self, megabytes):
+        self._nest_blocks(RstCloth(stream=None), megabytes * 1024 * 1024, 3)
+
+    def peakmem_rendered_content(self, megabytes):
+        self._nest_rendered(RstCloth(stream=None), megabytes * 1024 * 1024, 3)
+
+    def peakmem_blocks(self, megabytes):
+        self._nest_blocks(RstCloth(stream=None), megabytes * 1024 * 1024, 3)
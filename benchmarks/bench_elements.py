@@ -0,0 +1,137 @@
+import io
+
+from rstcloth import CompactRstCloth, RstCloth
+
+
+# Number of words in a paragraph, lines in a block or rows in a table, for
+# each input size.
+SIZES = {"small": 10, "medium": 1000, "huge": 100000}
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet"]
+
+
+def paragraph(words):
+    """Returns a paragraph of the given number of words."""
+    return " ".join(WORDS * (words // len(WORDS)) + WORDS[: words % len(WORDS)])
+
+
+class TimeElements:
+    """Every RstCloth element method, at small, medium and huge input sizes."""
+
+    params = list(SIZES)
+    param_names = ["size"]
+
+    def setup(self, size):
+        count = SIZES[size]
+        self.text = paragraph(count)
+        self.lines = ["    line {0} of a literal block".format(i) for i in range(count)]
+        self.fields = [("field{0}".format(i), "value {0}".format(i)) for i in range(min(count, 1000))]
+        self.header = ["name", "type", "default", "description"]
+        self.rows = [["name{0}".format(i), "str", None, "value number {0}".format(i)] for i in range(count)]
+        self.items = ["item {0} {1}".format(i, WORDS[i % len(WORDS)]) for i in range(count)]
+        self.list_rows = [["name{0}".format(i), ["first item", "second item"], "value"] for i in range(count)]
+
+    def time_content(self, size):
+        RstCloth(stream=None).content(self.text)
+
+    def time_content_indented(self, size):
+        RstCloth(stream=None).content(self.text, indent=4)
+
+    def time_heading(self, size):
+        RstCloth(stream=None).title(self.text)
+
+    def time_li(self, size):
+        RstCloth(stream=None).li(self.text, indent=2)
+
+    def time_li_loop(self, size):
+        r = RstCloth(stream=None)
+        for item in self.items:
+            r.li(item)
+
+    def time_li_many(self, size):
+        RstCloth(stream=None).li_many(self.items)
+
+    def time_content_many(self, size):
+        RstCloth(stream=None).content_many(self.items, indent=3)
+
+    def time_field_many(self, size):
+        RstCloth(stream=None).field_many(self.fields)
+
+    def time_definitions(self, size):
+        RstCloth(stream=None).definitions(self.fields)
+
+    def time_definition(self, size):
+        RstCloth(stream=None).definition("term", self.text, bold=True)
+
+    def time_footnote(self, size):
+        RstCloth(stream=None).footnote("ref", self.text)
+
+    def time_field(self, size):
+        RstCloth(stream=None).field("Abstract", self.text)
+
+    def time_replacement(self, size):
+        RstCloth(stream=None).replacement("name", self.text)
+
+    def time_directive(self, size):
+        RstCloth(stream=None).directive("note", "argument", fields=self.fields, content=self.text)
+
+    def time_admonition(self, size):
+        RstCloth(stream=None).warning(content=self.lines)
+
+    def time_codeblock(self, size):
+        RstCloth(stream=None).codeblock(self.lines, language="python")
+
+    def time_table(self, size):
+        RstCloth(stream=None).table(self.header, self.rows)
+
+    def time_simple_table(self, size):
+        RstCloth(stream=None).simple_table(self.header, self.rows)
+
+    def time_spooled_table(self, size):
+        RstCloth(stream=None).spooled_table(self.header, iter(self.rows))
+
+    def time_table_list(self, size):
+        RstCloth(stream=None).table_list(["name", "items", "value"], self.list_rows)
+
+    def time_inline(self, size):
+        RstCloth.role("ref", self.text)
+        RstCloth.bold(self.text)
+        RstCloth.emph(self.text)
+        RstCloth.pre(self.text)
+        RstCloth.inline_link(self.text, "https://example.com")
+        RstCloth.footnote_ref(self.text)
+
+    def time_markers(self, size):
+        r = RstCloth(stream=None)
+        for _ in range(min(SIZES[size], 10000)):
+            r.ref_target("target")
+            r.newline()
+            r.transition_marker()
+            r.page_break()
+            r.frame_break(10)
+            r.spacer(1, 2)
+            r.table_of_contents("Contents", depth=2)
+
+
+class TimeConstruction:
+    """Creating the short-lived RstCloth instances used to render fragments."""
+
+    def time_construct(self):
+        RstCloth(stream=io.StringIO())
+
+    def time_construct_compact(self):
+        CompactRstCloth(stream=io.StringIO())
+
+    def time_construct_owned_buffer(self):
+        RstCloth(stream=None)
+
+    def time_fragment(self):
+        r = RstCloth(stream=None)
+        r.field("Author", "me")
+        r.data
+
+    def mem_instance(self):
+        return RstCloth(stream=io.StringIO())
+
+    def mem_instance_compact(self):
+        return CompactRstCloth(stream=io.StringIO())
@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+from rstcloth import RstCloth
+from rstcloth.include import LineIndex, line_index
+
+
+class TimeLiteralInclude:
+    """Including 400 lines from the middle of source files of up to 1 GB."""
+
+    params = [10, 100, 1000]
+    param_names = ["megabytes"]
+    timeout = 600
+
+    def setup(self, megabytes):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "generated.py")
+        line = "    value_{0} = compute(value_{0}, 'generated source line')\n"
+        with open(self.path, "w", encoding="utf-8") as f:
+            size = 0
+            index = 0
+            while size < megabytes * 1024 * 1024:
+                lines = "".join(line.format(index + offset) for offset in range(1000))
+                f.write(lines)
+                size += len(lines)
+                index += 1000
+        self.start = index // 2
+        line_index(self.path)
+
+    def teardown(self, megabytes):
+        self.directory.cleanup()
+
+    def time_literal_include(self, megabytes):
+        RstCloth(stream=None).literal_include(self.path, self.start, self.start + 400, language="python")
+
+    def time_read_and_slice(self, megabytes):
+        with open(self.path, encoding="utf-8") as f:
+            first, last = self.start - 1, self.start + 400
+            lines = f.read().splitlines()[first:last]
+        RstCloth(stream=None).codeblock(lines, language="python")
+
+    def time_line_index(self, megabytes):
+        LineIndex(self.path)
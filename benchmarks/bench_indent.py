@@ -0,0 +1,85 @@
+import os
+import tempfile
+
+from rstcloth import RstCloth
+from rstcloth.rstcloth import _indent
+
+
+def splitlines_indent(content, indent):
+    """The previous _indent implementation, splitting content into a list of lines."""
+    prefix = " " * indent
+    return "\n".join([prefix + line if line else line for line in content.splitlines()])
+
+
+class TimeLiteralBlocks:
+    """Indenting and writing literal blocks of generated source of up to 100 MB."""
+
+    params = [1, 10, 100]
+    param_names = ["megabytes"]
+    timeout = 300
+
+    def setup(self, megabytes):
+        line = "    value_{0} = compute(value_{0}, 'generated source line')\n"
+        lines = []
+        size = 0
+        index = 0
+        while size < megabytes * 1024 * 1024:
+            text = line.format(index) if index % 10 else "\n"
+            lines.append(text)
+            size += len(text)
+            index += 1
+        self.source = "".join(lines)
+
+    def time_indent(self, megabytes):
+        _indent(self.source, 3)
+
+    def time_splitlines_indent(self, megabytes):
+        splitlines_indent(self.source, 3)
+
+    def time_codeblock(self, megabytes):
+        with open(os.devnull, "w") as stream:
+            RstCloth(stream=stream).codeblock(self.source, language="python")
+
+    def peakmem_codeblock(self, megabytes):
+        with open(os.devnull, "w") as stream:
+            RstCloth(stream=stream).codeblock(self.source, language="python")
+
+    def peakmem_splitlines_indent(self, megabytes):
+        with open(os.devnull, "w") as stream:
+            stream.write(splitlines_indent(self.source, 3))
+
+
+class TimeStreamedBlocks:
+    """Embedding log files of up to 500 MB as literal blocks, read a chunk at a time."""
+
+    params = [10, 100, 500]
+    param_names = ["megabytes"]
+    timeout = 600
+
+    def setup(self, megabytes):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "build.log")
+        line = "2024-01-01 00:00:00,000 INFO worker-{0}: processed request {0} in 12 ms\n"
+        with open(self.path, "w", encoding="utf-8") as f:
+            size = 0
+            index = 0
+            while size < megabytes * 1024 * 1024:
+                lines = "".join(line.format(index + offset) for offset in range(1000))
+                f.write(lines)
+                size += len(lines)
+                index += 1000
+
+    def teardown(self, megabytes):
+        self.directory.cleanup()
+
+    def time_codeblock_from_file(self, megabytes):
+        with open(os.devnull, "w") as stream, open(self.path, encoding="utf-8") as f:
+            RstCloth(stream=stream).codeblock(f, language="text")
+
+    def peakmem_codeblock_from_file(self, megabytes):
+        with open(os.devnull, "w") as stream, open(self.path, encoding="utf-8") as f:
+            RstCloth(stream=stream).codeblock(f, language="text")
+
+    def peakmem_codeblock_from_string(self, megabytes):
+        with open(os.devnull, "w") as stream, open(self.path, encoding="utf-8") as f:
+            RstCloth(stream=stream).codeblock(f.read(), language="text")
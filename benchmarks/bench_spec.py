@@ -0,0 +1,47 @@
+import os
+import tempfile
+
+from rstcloth import RstCloth
+from rstcloth.spec import render_spec
+
+
+SECTION = """\
+- h2: Section {0}
+- content: {1}
+- li: [first item, second item, third item]
+- note: {1}
+- table:
+    header: [name, type, description]
+    data: [[name, str, {1}], [size, int, {1}]]
+- codeblock: {{content: ["def f{0}(x):", "    return x"], language: python}}
+"""
+
+
+class TimeSpec:
+    """YAML specs of 1 MB and 10 MB, rendered into a discarding stream."""
+
+    params = [1, 10]
+    param_names = ["megabytes"]
+    timeout = 300
+
+    def setup(self, megabytes):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "spec.yaml")
+        text = " ".join(["lorem ipsum dolor sit amet"] * 4)
+        with open(self.path, "w") as f:
+            size = 0
+            index = 0
+            while size < megabytes * 1024 * 1024:
+                size += f.write(SECTION.format(index, text))
+                index += 1
+
+    def teardown(self, megabytes):
+        self.directory.cleanup()
+
+    def time_render(self, megabytes):
+        with open(self.path, "rb") as f, open(os.devnull, "w") as output:
+            render_spec(f, RstCloth(stream=output, buffer_size=65536))
+
+    def peakmem_render(self, megabytes):
+        with open(self.path, "rb") as f, open(os.devnull, "w") as output:
+            render_spec(f, RstCloth(stream=output, buffer_size=65536))
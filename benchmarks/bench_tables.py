@@ -0,0 +1,27 @@
+import io
+from tabulate import tabulate
+
+from rstcloth import RstCloth
+
+
+class TimeTables:
+    """Grid and simple tables from the built-in engine, against tabulate."""
+
+    params = [1000, 10000, 100000]
+    param_names = ["rows"]
+
+    def setup(self, rows):
+        self.header = ["name", "type", "default", "description"]
+        self.data = [["name{0}".format(i), "str", None, "value number {0}".format(i)] for i in range(rows)]
+
+    def time_table(self, rows):
+        RstCloth(stream=io.StringIO()).table(self.header, self.data)
+
+    def time_simple_table(self, rows):
+        RstCloth(stream=io.StringIO()).simple_table(self.header, self.data)
+
+    def time_tabulate_grid(self, rows):
+        tabulate(tabular_data=self.data, headers=self.header, tablefmt="grid", disable_numparse=True)
+
+    def time_tabulate_rst(self, rows):
+        tabulate(tabular_data=self.data, headers=self.header, tablefmt="rst", disable_numparse=True)
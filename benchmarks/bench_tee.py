@@ -0,0 +1,29 @@
+import gzip
+import hashlib
+import os
+
+from rstcloth import RstCloth
+from rstcloth.tee import TeeStream
+from .bench_documents import write_document
+
+
+class TimeTee:
+    """A 10 MB document written to a file, a gzip archive and a SHA-256 digest in one pass."""
+
+    params = [False, True]
+    param_names = ["threaded"]
+    timeout = 300
+
+    def _render(self, threaded):
+        with open(os.devnull, "w") as f, open(os.devnull, "wb") as archive:
+            compressed = gzip.GzipFile(fileobj=archive, mode="wb", compresslevel=6)
+            tee = TeeStream([f, compressed], hashers=[hashlib.sha256()], threaded=threaded)
+            r = RstCloth(stream=tee)
+            write_document(r, 10 * 1024 * 1024)
+            r.close()
+
+    def time_tee(self, threaded):
+        self._render(threaded)
+
+    def peakmem_tee(self, threaded):
+        self._render(threaded)
@@ -0,0 +1,33 @@
+from rstcloth.utils import first_whitespace_position, first_word_fits
+
+
+def loop_first_whitespace_position(string):
+    """The previous first_whitespace_position implementation, calling isspace() per character."""
+    counter = -1
+    for character in string:
+        counter += 1
+        if character.isspace():
+            return counter
+    return counter + 1
+
+
+class TimeFirstWhitespace:
+    """Finding the first word of field values of increasing length, without any whitespace in the worst case."""
+
+    params = ([10, 1000, 100000], ["words", "word"])
+    param_names = ["length", "text"]
+
+    def setup(self, length, text):
+        if text == "words":
+            self.value = ("lorem ipsum " * length)[:length]
+        else:
+            self.value = "x" * length
+
+    def time_loop(self, length, text):
+        loop_first_whitespace_position(self.value)
+
+    def time_first_whitespace_position(self, length, text):
+        first_whitespace_position(self.value)
+
+    def time_first_word_fits(self, length, text):
+        first_word_fits(self.value, 60)
@@ -0,0 +1,27 @@
+import textwrap
+
+from rstcloth.wrapping import fill
+
+
+class TimeFill:
+    """Wrapping paragraphs of increasing length, against textwrap.fill."""
+
+    params = [10, 100, 1000, 10000]
+    param_names = ["words"]
+
+    def setup(self, words):
+        self.text = " ".join(["lorem", "ipsum", "dolor", "sit", "amet"] * (words // 5))
+
+    def time_fill(self, words):
+        fill(self.text, 72, 3, 3)
+
+    def time_textwrap_fill(self, words):
+        textwrap.fill(
+            text=self.text,
+            width=72,
+            initial_indent="   ",
+            subsequent_indent="   ",
+            expand_tabs=False,
+            break_long_words=False,
+            break_on_hyphens=False,
+        )
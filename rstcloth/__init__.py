@@ -1,4 +1,30 @@
-from .rstcloth import RstCloth
+import typing
 
 
-__all__ = ["RstCloth"]
+__all__ = ["CompactRstCloth", "Field", "RstCloth", "RstDocument"]
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .document import RstDocument
+    from .rstcloth import CompactRstCloth, Field, RstCloth
+
+
+def __getattr__(name: str) -> typing.Any:
+    # The public names are imported from their modules on first use, so that
+    # importing rstcloth, or one of its lightweight modules such as
+    # rstcloth.wrapping, doesn't load the whole package.
+    if name == "RstDocument":
+        from .document import RstDocument as value
+    elif name == "RstCloth":
+        from .rstcloth import RstCloth as value
+    elif name == "CompactRstCloth":
+        from .rstcloth import CompactRstCloth as value
+    elif name == "Field":
+        from .rstcloth import Field as value
+    else:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
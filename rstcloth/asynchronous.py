@@ -0,0 +1,114 @@
+import inspect
+import io
+import typing
+
+from rstcloth.rstcloth import RstCloth
+
+
+class AsyncRstCloth(RstCloth):
+    """
+    AsyncRstCloth builds a ReStructuredText document with the same element
+    methods as RstCloth, writing it to an asyncio.StreamWriter or any other
+    writer with a write() method (plain or coroutine) and an optional
+    coroutine drain() method.
+
+    Element methods collect the document in a buffer. If the writer's
+    write() is a plain method, as with asyncio.StreamWriter, the buffer is
+    handed to the writer as soon as buffer_size characters are pending so
+    clients receive the first bytes straight away; awaiting drain() then
+    waits for the writer to catch up. A coroutine write() can only be
+    awaited, so with such writers the buffer is written on drain().
+
+    :param writer: output stream for writing ReStructuredText content
+    :param line_width: Maximum length of each ReStructuredText content line.
+        In some edge cases this limit might be crossed.
+    :param buffer_size: number of pending characters above which the buffer
+        is handed to the writer; at least 1, since content always goes
+        through the buffer to be encoded, and awaited for coroutine writers
+    :param encoding: encoding of the bytes passed to the writer, or None for
+        writers accepting strings
+    """
+
+    __slots__ = ("_encoding", "_coroutine_write")
+
+    def __init__(
+        self,
+        writer: typing.Any,
+        line_width: int = 72,
+        buffer_size: int = 65536,
+        encoding: typing.Optional[str] = "utf-8",
+    ) -> None:
+        if buffer_size is None or buffer_size < 1:
+            raise ValueError("AsyncRstCloth needs a buffer_size of at least 1, got {0!r}".format(buffer_size))
+        super().__init__(stream=writer, line_width=line_width, buffer_size=buffer_size)
+        self._encoding = encoding
+        self._coroutine_write = inspect.iscoroutinefunction(writer.write)
+
+    @classmethod
+    def open(cls, *args, **kwargs) -> typing.NoReturn:
+        """
+        AsyncRstCloth writes to asynchronous writers, not files; use
+        RstCloth.open to write a document to a file.
+        """
+        raise TypeError("AsyncRstCloth can't open files, use RstCloth.open")
+
+    async def __aenter__(self) -> "AsyncRstCloth":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.drain()
+
+    def _pending(self) -> typing.Union[str, bytes]:
+        """
+        Empties the buffer.
+
+        :return: the buffered content, encoded for the writer
+        """
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        if self._encoding is None:
+            return text
+        return text.encode(self._encoding)
+
+    def _flush_buffer(self) -> None:
+        """
+        Hands buffered content to a writer with a plain write() method.
+        """
+        if self._buffer and not self._coroutine_write:
+            self._stream.write(self._pending())
+
+    async def drain(self) -> None:
+        """
+        Writes any buffered content and waits until the writer is ready to
+        accept more.
+        """
+        if self._buffer:
+            result = self._stream.write(self._pending())
+            if inspect.isawaitable(result):
+                await result
+        drain = getattr(self._stream, "drain", None)
+        if drain is not None:
+            await drain()
+
+    async def aclose(self) -> None:
+        """
+        Writes any buffered content and closes the writer.
+        """
+        await self.drain()
+        result = self._stream.close()
+        if inspect.isawaitable(result):
+            await result
+        wait_closed = getattr(self._stream, "wait_closed", None)
+        if wait_closed is not None:
+            await wait_closed()
+
+    def flush(self) -> None:
+        raise io.UnsupportedOperation("AsyncRstCloth is flushed with 'await drain()'")
+
+    def close(self) -> None:
+        raise io.UnsupportedOperation("AsyncRstCloth is closed with 'await aclose()'")
+
+    @property
+    def data(self) -> str:
+        raise io.UnsupportedOperation("AsyncRstCloth output can't be read back")
@@ -0,0 +1,90 @@
+import bisect
+
+
+class ChunkBuffer:
+    """
+    ChunkBuffer is a write-only text stream which keeps what is written as a
+    list of chunks. Content is joined only when it is read, and can be read
+    from any earlier position without copying what comes before it.
+    """
+
+    __slots__ = ("_chunks", "_ends", "closed")
+
+    def __init__(self) -> None:
+        self._chunks = []
+        # _ends[i] is the position right after self._chunks[i].
+        self._ends = []
+        self.closed = False
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def write(self, text: str) -> int:
+        """
+        Appends text to the buffer.
+
+        :param text: the text to append
+        :return: the number of characters written
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed buffer.")
+        if text:
+            self._chunks.append(text)
+            self._ends.append(len(self) + len(text))
+        return len(text)
+
+    def tell(self) -> int:
+        """
+        Returns the current position, i.e. the number of characters written.
+
+        :return: the position
+        """
+        return len(self)
+
+    def getvalue(self, start: int = 0) -> str:
+        """
+        Returns the content written since a position.
+
+        :param start: the position to read from, as returned by tell()
+        :return: the content after start
+        """
+        if start <= 0:
+            if len(self._chunks) > 1:
+                # Keep the joined value so that it isn't joined again.
+                self._chunks[:] = ["".join(self._chunks)]
+                self._ends[:] = self._ends[-1:]
+            return self._chunks[0] if self._chunks else ""
+        index = bisect.bisect_right(self._ends, start)
+        if index == len(self._chunks):
+            return ""
+        begin = self._ends[index - 1] if index else 0
+        offset = start - begin
+        following = index + 1
+        return "".join([self._chunks[index][offset:], *self._chunks[following:]])
+
+    def getbuffer(self, encoding: str = "utf-8") -> memoryview:
+        """
+        Returns the content encoded, without joining it into a string first.
+
+        :param encoding: the encoding of the content
+        :return: a view of the encoded content
+        """
+        data = bytearray()
+        for chunk in self._chunks:
+            data += chunk.encode(encoding)
+        return memoryview(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def readable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
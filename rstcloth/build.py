@@ -0,0 +1,276 @@
+import concurrent.futures
+import hashlib
+import io
+import itertools
+import json
+import os
+import secrets
+import stat
+import time
+import typing
+
+from rstcloth.document import RstDocument
+from rstcloth.rstcloth import RstCloth
+
+
+t_path = typing.Union[str, os.PathLike]
+t_source = typing.Union[typing.Callable[[RstCloth], None], RstDocument]
+
+
+class ManifestEntry(typing.NamedTuple):
+    """
+    What a manifest records about a written file.
+
+    :param digest: SHA-256 hex digest of the content of the file
+    :param size: size of the file in bytes
+    :param mtime_ns: modification time of the file, in nanoseconds
+    """
+
+    digest: str
+    size: int
+    mtime_ns: int
+
+
+class BuildResult(typing.NamedTuple):
+    """
+    Outcome of building one document.
+
+    :param path: the path the document was written to
+    :param seconds: wall time taken to render and write the document
+    :param size: number of bytes written
+    :param written: False if the file already had this content and was left
+        untouched
+    :param entry: manifest entry of the file, for incremental builds
+    """
+
+    path: str
+    seconds: float
+    size: int
+    written: bool = True
+    entry: typing.Optional[ManifestEntry] = None
+
+
+def write_atomic(path: t_path, data: bytes) -> None:
+    """
+    Writes data to a temporary file next to path, then moves it into place,
+    so readers never see a partially written file. The file keeps the
+    permissions of the file it replaces; a new file gets the permissions
+    open() would give it.
+
+    :param path: the file to write
+    :param data: the content of the file
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary_path = os.path.join(directory, ".{0}.tmp".format(secrets.token_hex(8)))
+    # Unlike mkstemp(), which creates files readable by their owner only,
+    # this leaves the umask to the kernel, as open() does.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    descriptor = os.open(temporary_path, flags, 0o666)
+    try:
+        with os.fdopen(descriptor, "wb") as temporary_file:
+            temporary_file.write(data)
+        try:
+            os.chmod(temporary_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def _file_digest(path: t_path) -> str:
+    """
+    Hashes the content of a file.
+
+    :param path: the file to hash
+    :return: SHA-256 hex digest of the content of the file
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_if_changed(
+    path: t_path, data: bytes, previous: typing.Optional[ManifestEntry] = None
+) -> typing.Tuple[bool, ManifestEntry]:
+    """
+    Writes data atomically unless the file already holds it, so that
+    unchanged files keep their modification time. The file is trusted to be
+    unchanged when it still matches its previous manifest entry; otherwise
+    its content is hashed, if its size matches.
+
+    :param path: the file to write
+    :param data: the content of the file
+    :param previous: the manifest entry of the file from an earlier build
+    :return: whether the file was written, and its new manifest entry
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        status = os.stat(path)
+    except FileNotFoundError:
+        status = None
+    if status is not None and status.st_size == len(data):
+        entry = ManifestEntry(digest, status.st_size, status.st_mtime_ns)
+        if previous == entry:
+            return False, entry
+        if _file_digest(path) == digest:
+            return False, entry
+    write_atomic(path, data)
+    return True, ManifestEntry(digest, len(data), os.stat(path).st_mtime_ns)
+
+
+class Manifest:
+    """
+    Content hashes of the files written by earlier builds, stored as JSON,
+    so that a build only rewrites the files whose content changed.
+
+    Paths are recorded relative to the directory of the manifest.
+
+    :param path: the manifest file, loaded if it exists
+    """
+
+    __slots__ = ("path", "entries", "_changed")
+
+    def __init__(self, path: t_path) -> None:
+        self.path = os.path.abspath(path)
+        self.entries = {}
+        self._changed = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        self.entries = {name: ManifestEntry(*entry) for name, entry in entries.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _key(self, path: t_path) -> str:
+        """
+        :param path: a written file
+        :return: the name of the file in the manifest
+        """
+        return os.path.relpath(os.path.abspath(path), os.path.dirname(self.path)).replace(os.sep, "/")
+
+    def get(self, path: t_path) -> typing.Optional[ManifestEntry]:
+        """
+        :param path: a written file
+        :return: the manifest entry of the file, or None if it isn't recorded
+        """
+        return self.entries.get(self._key(path))
+
+    def update(self, path: t_path, entry: ManifestEntry) -> None:
+        """
+        Records the manifest entry of a file.
+
+        :param path: a written file
+        :param entry: the manifest entry of the file
+        """
+        key = self._key(path)
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self._changed = True
+
+    def write(self, path: t_path, data: bytes) -> bool:
+        """
+        Writes a file unless it already holds data, and records it.
+
+        :param path: the file to write
+        :param data: the content of the file
+        :return: whether the file was written
+        """
+        written, entry = write_if_changed(path, data, self.get(path))
+        self.update(path, entry)
+        return written
+
+    def save(self) -> None:
+        """
+        Writes the manifest atomically, if any of its entries changed.
+        """
+        if self._changed:
+            entries = {name: list(entry) for name, entry in sorted(self.entries.items())}
+            write_atomic(self.path, json.dumps(entries, indent=1).encode("utf-8"))
+            self._changed = False
+
+
+def build_document(
+    path: t_path,
+    source: t_source,
+    line_width: int = 72,
+    encoding: str = "utf-8",
+    incremental: bool = False,
+    previous: typing.Optional[ManifestEntry] = None,
+) -> BuildResult:
+    """
+    Renders one document and writes it atomically.
+
+    :param path: the file to write
+    :param source: a callable filling in the RstCloth it is given, or an
+        RstDocument
+    :param line_width: maximum length of each ReStructuredText content line
+    :param encoding: the encoding of the written file
+    :param incremental: leave the file untouched if it already holds the
+        rendered document
+    :param previous: the manifest entry of the file from an earlier build
+    :return: timing and size of the document
+    """
+    start = time.perf_counter()
+    stream = io.StringIO()
+    if isinstance(source, RstDocument):
+        source.write_to(stream, line_width=line_width)
+    else:
+        source(RstCloth(stream=stream, line_width=line_width))
+    data = stream.getvalue().encode(encoding)
+    if not incremental:
+        write_atomic(path, data)
+        return BuildResult(os.fspath(path), time.perf_counter() - start, len(data))
+    written, entry = write_if_changed(path, data, previous)
+    return BuildResult(os.fspath(path), time.perf_counter() - start, len(data), written, entry)
+
+
+def build_documents(
+    documents: typing.Mapping[t_path, t_source],
+    max_workers: int = None,
+    chunksize: int = 1,
+    line_width: int = 72,
+    encoding: str = "utf-8",
+    manifest: t_path = None,
+) -> typing.List[BuildResult]:
+    """
+    Renders many documents across a pool of processes. Each document is
+    described either by a callable, which is passed an RstCloth to fill in,
+    or by an RstDocument. Both must be picklable, so callables have to be
+    module level functions (or functools.partial objects wrapping them).
+
+    :param documents: a mapping of output paths to document sources
+    :param max_workers: number of worker processes, defaults to the number
+        of processors; with 1 the documents are built in this process
+    :param chunksize: number of documents sent to a worker at a time
+    :param line_width: maximum length of each ReStructuredText content line
+    :param encoding: the encoding of the written files
+    :param manifest: if given, the JSON manifest of content hashes to build
+        incrementally with: documents whose content didn't change since the
+        manifest was saved are not rewritten, and keep their modification
+        time
+    :return: timing and size of each document, in the order of documents
+    """
+    paths = list(documents)
+    sources = [documents[path] for path in paths]
+    arguments = (paths, sources, itertools.repeat(line_width), itertools.repeat(encoding))
+    if manifest is not None:
+        manifest = Manifest(manifest)
+        arguments += (itertools.repeat(True), [manifest.get(path) for path in paths])
+    if max_workers == 1:
+        results = list(map(build_document, *arguments))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(build_document, *arguments, chunksize=chunksize))
+    if manifest is not None:
+        for result in results:
+            manifest.update(result.path, result.entry)
+        manifest.save()
+    return results
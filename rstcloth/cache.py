@@ -0,0 +1,72 @@
+import collections
+import typing
+
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class FormatCache:
+    """
+    Least-recently-used cache of formatted ReStructuredText, counting hits
+    and misses like functools.lru_cache does.
+
+    :param maxsize: maximum number of entries to keep
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: typing.Hashable) -> typing.Optional[str]:
+        """
+        Returns cached text and marks it as recently used.
+
+        :param key: the method name and arguments the text was formatted from
+        :return: the cached text, or None on a miss
+        """
+        try:
+            text = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def put(self, key: typing.Hashable, text: str) -> None:
+        """
+        Stores text, evicting the least recently used entry if the cache is
+        full.
+
+        :param key: the method name and arguments the text was formatted from
+        :param text: the formatted text
+        """
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the hit and miss counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Returns cache statistics.
+
+        :return: hits, misses, maximum and current size of the cache
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
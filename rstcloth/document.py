@@ -0,0 +1,133 @@
+import inspect
+import io
+import typing
+
+from rstcloth.rstcloth import CompactRstCloth, RstCloth
+
+
+# RstCloth attributes which either don't write to the document or need no
+# deferring, because they only return inline markup.
+_NOT_ELEMENTS = frozenset(
+    [
+        "data",
+        "data_since",
+        "mark",
+        "getbuffer",
+        "fill",
+        "flush",
+        "close",
+        "fragment",
+        "block",
+        "directive_block",
+        "open",
+    ]
+)
+_INLINE = frozenset(["role", "bold", "emph", "pre", "inline_link", "footnote_ref"])
+
+
+def _is_element(cls: type, name: str) -> bool:
+    """
+    Tells element methods from helpers, properties and inline markup.
+
+    :param cls: an RstCloth class
+    :param name: the name of an attribute of the class
+    :return: whether the attribute is a method writing to the document
+    """
+    if name.startswith("_") or name in _NOT_ELEMENTS:
+        return False
+    attribute = inspect.getattr_static(cls, name)
+    if isinstance(attribute, (staticmethod, classmethod, property)):
+        return False
+    return callable(getattr(cls, name))
+
+
+class Node:
+    """
+    A deferred call of one RstCloth element method.
+
+    :param name: the name of the RstCloth method, e.g. "h1" or "table"
+    :param args: positional arguments of the call
+    :param kwargs: keyword arguments of the call
+    """
+
+    __slots__ = ("name", "args", "kwargs")
+
+    def __init__(self, name: str, args: tuple, kwargs: dict) -> None:
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return "Node({0!r}, {1!r}, {2!r})".format(self.name, self.args, self.kwargs)
+
+    def render(self, cloth: RstCloth) -> None:
+        """
+        Replays the call against an RstCloth.
+
+        :param cloth: the RstCloth to write this element into
+        """
+        getattr(cloth, self.name)(*self.args, **self.kwargs)
+
+
+class RstDocument:
+    """
+    RstDocument records RstCloth element calls (h1, content, directive, li,
+    table...) as a list of nodes instead of writing them, and renders them
+    only when render() or write_to() is called. The same document can
+    therefore be rendered several times, e.g. at different line widths, and
+    nodes can be reordered or removed before anything is formatted.
+
+    Arguments are stored as given, so a node holding an iterator (e.g. the
+    rows of a spooled_table) can only be rendered once.
+
+    :param line_width: default maximum length of each ReStructuredText
+        content line
+    """
+
+    __slots__ = ("nodes", "line_width")
+
+    def __init__(self, line_width: int = 72) -> None:
+        self.nodes = []
+        self.line_width = line_width
+
+    def __getattr__(self, name: str) -> typing.Callable:
+        attribute = getattr(RstCloth, name)
+        if name in _INLINE:
+            return attribute
+        if name.startswith("_") or name in _NOT_ELEMENTS or not callable(attribute):
+            raise AttributeError("{0!r} is not a document element".format(name))
+
+        def add_node(*args, **kwargs) -> None:
+            self.nodes.append(Node(name, args, kwargs))
+
+        return add_node
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def write_to(self, stream: typing.TextIO, line_width: int = None) -> None:
+        """
+        Renders the document into a stream.
+
+        :param stream: output stream for writing ReStructuredText content
+        :param line_width: maximum length of each ReStructuredText content
+            line, defaults to the document's line width
+        """
+        cloth = CompactRstCloth(
+            stream=stream, line_width=self.line_width if line_width is None else line_width, buffer_size=65536
+        )
+        for node in self.nodes:
+            node.render(cloth)
+        cloth.flush()
+
+    def render(self, line_width: int = None) -> str:
+        """
+        Renders the document as a string.
+
+        :param line_width: maximum length of each ReStructuredText content
+            line, defaults to the document's line width
+        :return: ReStructuredText document content
+        """
+        stream = io.StringIO()
+        self.write_to(stream, line_width=line_width)
+        return stream.getvalue()
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import typing
+
+from rstcloth.build import t_path, write_atomic
+from rstcloth.cache import CacheInfo
+
+
+class FragmentStore:
+    """
+    Directory of rendered ReStructuredText fragments, for RstCloth.fragment.
+    Each fragment is kept in a file named by its key. Once the files take
+    more than max_size bytes, the least recently used ones are removed.
+
+    The store can be shared by several processes and kept between builds.
+
+    :param directory: the directory to keep fragments in, created if needed
+    :param max_size: maximum combined size of the fragment files, in bytes
+    """
+
+    __slots__ = ("directory", "max_size", "hits", "misses", "_size")
+
+    def __init__(self, directory: t_path, max_size: int = 64 * 1024 * 1024) -> None:
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._entries())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+    def _entries(self) -> typing.Iterator[os.DirEntry]:
+        """
+        :return: iterator over the fragment files
+        """
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".rst") and entry.is_file():
+                    yield entry
+
+    def _path(self, key: str) -> str:
+        """
+        :param key: the key of a fragment
+        :return: the file of the fragment
+        """
+        return os.path.join(self.directory, key + ".rst")
+
+    @staticmethod
+    def key(name: str, inputs: typing.Any, line_width: int, indent: int = 0) -> str:
+        """
+        Returns the key of a fragment.
+
+        :param name: the name of the fragment
+        :param inputs: the data the fragment is rendered from
+        :param line_width: the line width the fragment is rendered with
+        :param indent: the indentation of the block the fragment is rendered
+            in, see RstCloth.block
+        :return: SHA-256 hex digest of the name, inputs, line width and
+            indentation
+        """
+        description = [name, line_width, inputs]
+        if indent:
+            description.append(indent)
+        description = json.dumps(description, sort_keys=True, default=repr)
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> typing.Optional[str]:
+        """
+        Returns a cached fragment and marks it as recently used.
+
+        :param key: the key of the fragment
+        :return: the rendered fragment, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8", newline="") as f:
+                text = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Caches a fragment, evicting the least recently used fragments if the
+        store grows past max_size.
+
+        :param key: the key of the fragment
+        :param text: the rendered fragment
+        """
+        data = text.encode("utf-8")
+        if len(data) > self.max_size:
+            return
+        write_atomic(self._path(key), data)
+        self._size += len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used fragments until the store fits in
+        max_size.
+        """
+        entries = [(entry.stat(), entry.path) for entry in self._entries()]
+        entries.sort(key=lambda item: item[0].st_mtime_ns)
+        self._size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if self._size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            self._size -= stat.st_size
+
+    def clear(self) -> None:
+        """
+        Removes every fragment and resets the hit and miss counters.
+        """
+        for entry in list(self._entries()):
+            os.unlink(entry.path)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        :return: the share of lookups which found their fragment, or 0.0
+            before any lookup
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self) -> CacheInfo:
+        """
+        Reports cache statistics, with sizes in bytes.
+
+        :return: hits, misses, maximum size and current size
+        """
+        return CacheInfo(self.hits, self.misses, self.max_size, self._size)
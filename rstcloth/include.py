@@ -0,0 +1,127 @@
+import array
+import collections
+import itertools
+import mmap
+import operator
+import os
+import typing
+
+
+t_path = typing.Union[str, os.PathLike]
+
+# Number of files whose line index is kept, least recently used first.
+INDEX_CACHE_SIZE = 32
+
+# Files are scanned for line breaks this many bytes at a time.
+_SCAN_SIZE = 16 * 1024 * 1024
+
+_indexes = collections.OrderedDict()
+
+
+class LineIndex:
+    """
+    Byte offset of the start of each line of a file, so that any range of
+    lines can be sliced from the file without reading what comes before it.
+
+    :param path: the file to index
+    """
+
+    __slots__ = ("path", "mtime_ns", "size", "offsets")
+
+    def __init__(self, path: t_path) -> None:
+        self.path = os.fspath(path)
+        stat = os.stat(self.path)
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        # offsets[i] is the position right after the i-th "\n".
+        self.offsets = array.array("Q", [0])
+        if not self.size:
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ends = range(_SCAN_SIZE, self.size + _SCAN_SIZE, _SCAN_SIZE)
+            for position, end in zip(range(0, self.size, _SCAN_SIZE), ends):
+                parts = mapped[position:end].split(b"\n")
+                del parts[-1]
+                # The position right after each "\n" is the combined length
+                # of the parts before it, plus one byte per "\n".
+                self.offsets.extend(
+                    map(operator.add, itertools.accumulate(map(len, parts)), itertools.count(position + 1))
+                )
+
+    def __len__(self) -> int:
+        """
+        :return: the number of lines in the file
+        """
+        if self.offsets[-1] == self.size:
+            return len(self.offsets) - 1
+        return len(self.offsets)
+
+    def is_current(self) -> bool:
+        """
+        :return: whether the file is unchanged since it was indexed
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def span(self, start: int = None, end: int = None) -> typing.Tuple[int, int]:
+        """
+        Returns the byte range of a range of lines.
+
+        :param start: the first line, counting from 1; defaults to the first
+            line of the file
+        :param end: the last line, included; defaults to the last line of the
+            file
+        :return: the offsets of the first byte of the range and of the byte
+            right after it
+        """
+        count = len(self)
+        start = 1 if start is None else start
+        end = count if end is None else min(end, count)
+        if start < 1:
+            raise ValueError("Line numbers start at 1, got {0}".format(start))
+        if end < start:
+            return 0, 0
+        last = self.offsets[end] if end < len(self.offsets) else self.size
+        return self.offsets[start - 1], last
+
+
+def line_index(path: t_path) -> LineIndex:
+    """
+    Returns the line index of a file, indexing it only if it isn't cached or
+    has been modified since.
+
+    :param path: the file to index
+    :return: the line index of the file
+    """
+    key = os.path.realpath(path)
+    index = _indexes.get(key)
+    if index is None or not index.is_current():
+        index = _indexes[key] = LineIndex(key)
+        if len(_indexes) > INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    _indexes.move_to_end(key)
+    return index
+
+
+def read_lines(path: t_path, start: int = None, end: int = None, encoding: str = "utf-8") -> str:
+    """
+    Reads a range of lines of a file, memory mapping the file and decoding
+    only the bytes of those lines.
+
+    :param path: the file to read
+    :param start: the first line, counting from 1; defaults to the first
+        line of the file
+    :param end: the last line, included; defaults to the last line of the
+        file
+    :param encoding: the encoding of the file
+    :return: the text of the lines
+    """
+    index = line_index(path)
+    first, last = index.span(start, end)
+    if first == last:
+        return ""
+    with open(index.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return mapped[first:last].decode(encoding)
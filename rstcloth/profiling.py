@@ -0,0 +1,254 @@
+import json
+import marshal
+import time
+import typing
+
+from rstcloth.document import _is_element
+from rstcloth.rstcloth import RstCloth, t_content
+
+
+# Instrumented subclasses, keyed by the class they were generated from.
+_instrumented_classes = {}
+
+
+class ElementStats:
+    """
+    Counters of one RstCloth element method.
+
+    :param calls: number of calls of the method
+    :param seconds: cumulative wall time spent in the method
+    :param bytes: number of bytes (UTF-8 encoded) the method wrote
+    :param fills: number of paragraphs the method wrapped with fill()
+    """
+
+    __slots__ = ("calls", "seconds", "bytes", "fills")
+
+    def __init__(self, calls: int = 0, seconds: float = 0.0, bytes: int = 0, fills: int = 0) -> None:
+        self.calls = calls
+        self.seconds = seconds
+        self.bytes = bytes
+        self.fills = fills
+
+    def __repr__(self) -> str:
+        return "ElementStats(calls={0}, seconds={1}, bytes={2}, fills={3})".format(
+            self.calls, self.seconds, self.bytes, self.fills
+        )
+
+    def as_dict(self) -> dict:
+        """
+        :return: the counters as a dictionary
+        """
+        return {"calls": self.calls, "seconds": self.seconds, "bytes": self.bytes, "fills": self.fills}
+
+
+class Profile:
+    """
+    Per element statistics of an instrumented RstCloth. Calls made by an
+    element method to other element methods (e.g. h1 calling heading) are
+    accounted to the outermost method only.
+
+    A Profile can be passed to pstats.Stats, or dumped with dump_stats() to
+    a file pstats and profile viewers can read.
+    """
+
+    def __init__(self) -> None:
+        self.elements = {}
+        self.stats = {}
+        self._current = None
+
+    def __getitem__(self, name: str) -> ElementStats:
+        return self.elements[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.elements
+
+    def _enter(self, name: str) -> ElementStats:
+        """
+        Starts accounting work to an element method.
+
+        :param name: the name of the method
+        :return: the statistics of the method
+        """
+        stats = self.elements.get(name)
+        if stats is None:
+            stats = self.elements[name] = ElementStats()
+        stats.calls += 1
+        self._current = stats
+        return stats
+
+    def clear(self) -> None:
+        """
+        Resets all counters.
+        """
+        self.elements.clear()
+
+    def as_dict(self) -> dict:
+        """
+        :return: the counters of each element method as a dictionary
+        """
+        return {name: stats.as_dict() for name, stats in sorted(self.elements.items())}
+
+    def dump_json(self, stream: typing.TextIO, **kwargs) -> None:
+        """
+        Writes the counters of each element method as JSON.
+
+        :param stream: output stream for the JSON document
+        :param kwargs: keyword arguments of json.dump, e.g. indent
+        """
+        json.dump(self.as_dict(), stream, **kwargs)
+
+    def create_stats(self) -> None:
+        """
+        Converts the counters into the format of cProfile.Profile.stats,
+        with one entry per element method.
+        """
+        self.stats = {
+            ("rstcloth", 0, name): (stats.calls, stats.calls, stats.seconds, stats.seconds, {})
+            for name, stats in self.elements.items()
+        }
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Writes the counters in the format of cProfile.Profile.dump_stats.
+
+        :param path: the file to write
+        """
+        self.create_stats()
+        with open(path, "wb") as f:
+            marshal.dump(self.stats, f)
+
+
+def _size(content: t_content, indent: int = 0) -> int:
+    """
+    Returns the number of bytes RstCloth._add writes for content.
+
+    :param content: the text written into an element
+    :param indent: the indentation of the enclosing blocks, which every
+        nonempty line is prefixed with
+    :return: the UTF-8 encoded size of the indented text and its newline
+    """
+    if isinstance(content, list):
+        content = "\n".join(content)
+    size = len(content) if content.isascii() else len(content.encode("utf-8"))
+    if indent:
+        size += indent * sum(1 for line in content.split("\n") if line)
+    return size + 1
+
+
+def _counted(chunks: typing.Iterable[str], stats: ElementStats, indent: int = 0) -> typing.Iterator[str]:
+    """
+    Adds the size of each chunk RstCloth._add_chunks writes to stats.
+
+    :param chunks: the parts of the text written into an element
+    :param stats: the statistics of the element
+    :param indent: the indentation of the enclosing blocks
+    :return: iterator over the same chunks
+    """
+    line_start = True
+    for chunk in chunks:
+        stats.bytes += _size(chunk, indent) - 1
+        if chunk:
+            if not line_start and chunk[0] != "\n":
+                # The first line continues one which is already indented.
+                stats.bytes -= indent
+            line_start = chunk[-1] == "\n"
+        yield chunk
+
+
+def _wrap_element(name: str, method: typing.Callable) -> typing.Callable:
+    """
+    Returns an element method recording its calls into the profile of the
+    instance.
+
+    :param name: the name of the method
+    :param method: the method of the instrumented class
+    :return: the instrumented method
+    """
+
+    def element(self, *args, **kwargs):
+        profile = self._profile
+        if profile._current is not None:
+            return method(self, *args, **kwargs)
+        stats = profile._enter(name)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats.seconds += time.perf_counter() - start
+            profile._current = None
+
+    element.__name__ = name
+    element.__doc__ = method.__doc__
+    return element
+
+
+def _instrumented_class(cls: type) -> type:
+    """
+    Returns a subclass of cls whose element methods record their calls.
+
+    :param cls: RstCloth or a subclass of it
+    :return: the instrumented subclass
+    """
+    try:
+        return _instrumented_classes[cls]
+    except KeyError:
+        pass
+
+    def fill(self, text: str, initial_indent: int = 0, subsequent_indent: int = 0) -> str:
+        profile = self._profile
+        stats = profile._current
+        if stats is None:
+            stats = profile._enter("fill")
+            profile._current = None
+        stats.fills += 1
+        return cls.fill(self, text, initial_indent, subsequent_indent)
+
+    def _add(self, content: t_content) -> None:
+        stats = self._profile._current
+        if stats is not None:
+            stats.bytes += _size(content, self._block_indent)
+        cls._add(self, content)
+
+    def _add_chunks(self, chunks: typing.Iterable[str]) -> None:
+        stats = self._profile._current
+        if stats is not None:
+            stats.bytes += 1
+            chunks = _counted(chunks, stats, self._block_indent)
+        cls._add_chunks(self, chunks)
+
+    namespace = {"__slots__": (), "fill": fill, "_add": _add, "_add_chunks": _add_chunks}
+    for name in dir(cls):
+        if _is_element(cls, name):
+            namespace[name] = _wrap_element(name, getattr(cls, name))
+    instrumented = _instrumented_classes[cls] = type("Instrumented" + cls.__name__, (cls,), namespace)
+    return instrumented
+
+
+def instrument(cloth: RstCloth) -> Profile:
+    """
+    Starts recording, for each element method of an RstCloth, the number of
+    calls, the wall time spent, the bytes written and the number of fill()
+    calls. Until this is called, RstCloth runs without any instrumentation.
+
+    :param cloth: the RstCloth to instrument
+    :return: the profile the statistics are recorded into
+    """
+    if getattr(cloth, "_profile", None) is None:
+        cloth._profile = Profile()
+        cloth.__class__ = _instrumented_class(type(cloth))
+    return cloth._profile
+
+
+def uninstrument(cloth: RstCloth) -> typing.Optional[Profile]:
+    """
+    Stops recording statistics of an RstCloth.
+
+    :param cloth: an RstCloth instrumented with instrument()
+    :return: the profile the statistics were recorded into, or None if the
+        RstCloth wasn't instrumented
+    """
+    profile = getattr(cloth, "_profile", None)
+    if profile is not None:
+        cloth.__class__ = type(cloth).__bases__[0]
+        cloth._profile = None
+    return profile
@@ -1,19 +1,87 @@
+import contextlib
 import functools
+import itertools
+import os
+import re
 import sys
-import textwrap
 import typing
-from tabulate import tabulate
 
-from rstcloth.utils import first_whitespace_position
+from rstcloth import tables
+from rstcloth.buffer import ChunkBuffer
+from rstcloth.cache import FormatCache
+from rstcloth.compression import COMPRESS_CHUNK_SIZE, CompressedWriter, compression_for
+from rstcloth.utils import first_word_fits
+from rstcloth.wrapping import get_wrapper
+
+
+class Field(typing.NamedTuple):
+    """
+    A name and value pair, for the fields of a directive or a field list.
+    """
+
+    name: str
+    value: str
 
 
 t_content = typing.Union[str, typing.List[str]]
-t_fields = typing.Iterable[typing.Tuple[str, str]]
+t_source = typing.Union[t_content, os.PathLike, typing.TextIO, typing.Iterable[str]]
+t_fields = typing.Iterable[typing.Union[Field, typing.Tuple[str, str]]]
 t_optional_2d_array = typing.Optional[typing.List[typing.List]]
+t_rows = typing.Optional[typing.Iterable[typing.Iterable]]
 t_width = typing.Union[int, str]
 t_widths = typing.Union[typing.List[int], str]
 
 
+# Text without any line break other than "\n" splits into the same lines
+# with str.split("\n") as with str.splitlines(), so it can be indented
+# without splitting it into a list of lines.
+_ascii_line_breaks = "\r\x0b\x0c\x1c\x1d\x1e"
+_other_line_breaks = re.compile(r"[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]").search
+
+
+def _has_other_line_breaks(text: str) -> bool:
+    """
+    Tells whether str.splitlines() would split text on anything but "\n".
+
+    :param text: text to be split into lines
+    :return: whether text contains a line break other than "\n"
+    """
+    if text.isascii():
+        # Searching for each character is much faster than a regex scan.
+        return any(character in text for character in _ascii_line_breaks)
+    return _other_line_breaks(text) is not None
+
+
+# Literal blocks longer than this many characters are indented and written a
+# chunk at a time.
+INDENT_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _prefix(indent: int) -> str:
+    """
+    Returns the indentation string for a number of spaces.
+
+    :param indent: number of spaces to indent
+    :return: a string of indent spaces
+    """
+    return " " * indent
+
+
+def _indent_text(text: str, prefix: str) -> str:
+    """
+    Prepends each nonempty line of text separated by "\n" only with prefix.
+
+    :param text: text to be indented
+    :param prefix: the indentation string
+    :return: modified text where each nonempty line is indented
+    """
+    if not text or text[0] == "\n" or text[-1] == "\n" or "\n\n" in text:
+        # Empty lines stay empty, so the lines have to be indented one by one.
+        return "\n".join([prefix + line if line else line for line in text.split("\n")])
+    return prefix + text.replace("\n", "\n" + prefix)
+
+
 def _indent(content: t_content, indent: int) -> str:
     """
     Prepends each nonempty line in content parameter with spaces.
@@ -24,25 +92,238 @@ def _indent(content: t_content, indent: int) -> str:
     """
     if indent == 0:
         return content
-    indent = " " * indent
+    prefix = _prefix(indent)
     if isinstance(content, str):
+        if len(content) > INDENT_CHUNK_SIZE:
+            return "".join(_iter_indent(content, indent))
+        if not _has_other_line_breaks(content):
+            return _indent_text(content[:-1] if content.endswith("\n") else content, prefix)
         content = content.splitlines()
-    return "\n".join([indent + line if line else line for line in content])
+    return "\n".join([prefix + line if line else line for line in content])
 
 
-class RstCloth:
+def _iter_indent(content: t_content, indent: int, chunk_size: int = INDENT_CHUNK_SIZE) -> typing.Iterator[str]:
     """
-    RstCloth is the base class to create a ReStructuredText document
-    programmatically.
+    Generates _indent(content, indent) as a series of strings of about
+    chunk_size characters, so that large content is never copied whole.
 
-    :param stream: output stream for writing ReStructuredText content
-    :param line_width: Maximum length of each ReStructuredText content line.
-        In some edge cases this limit might be crossed.
+    :param content: text to be indented
+    :param indent: number of spaces to indent this element
+    :param chunk_size: number of characters of content to indent at once
+    :return: iterator over consecutive parts of the indented content
+    """
+    if indent == 0 and isinstance(content, str):
+        yield content
+        return
+    prefix = _prefix(indent)
+    if isinstance(content, str) and not _has_other_line_breaks(content):
+        # The final line break is dropped, as str.splitlines() drops it.
+        total = len(content) - 1 if content.endswith("\n") else len(content)
+        position = 0
+        # Chunks end at a "\n", which is written separately, so that each
+        # chunk is indented on its own exactly as it is within the whole text.
+        end = content.find("\n", chunk_size, total)
+        while end != -1:
+            yield _indent_text(content[position:end], prefix)
+            yield "\n"
+            position = end + 1
+            end = content.find("\n", position + chunk_size, total)
+        yield _indent_text(content[position:total], prefix)
+        return
+    if isinstance(content, str):
+        starts = range(0, len(content), chunk_size)
+        ends = range(chunk_size, len(content) + chunk_size, chunk_size)
+        slices = (content[start:end] for start, end in zip(starts, ends))
+        yield from _iter_indent_text(slices, indent)
+        return
+    lines = iter(content)
+    batch_size = max(chunk_size // 64, 1)
+    batch = list(itertools.islice(lines, batch_size))
+    while True:
+        yield "\n".join([prefix + line if line else line for line in batch])
+        batch = list(itertools.islice(lines, batch_size))
+        if not batch:
+            return
+        yield "\n"
+
+
+def _indent_piece(piece: str, prefix: str) -> str:
+    """
+    Prepends each nonempty line of a piece of text followed by "\n" with
+    prefix.
+
+    :param piece: text to be indented, without its final "\n"
+    :param prefix: the indentation string
+    :return: modified text where each nonempty line is indented
+    """
+    if not _has_other_line_breaks(piece):
+        return _indent_text(piece, prefix)
+    return "\n".join([prefix + line if line else line for line in (piece + "\n").splitlines()])
+
+
+def _iter_indent_text(chunks: typing.Iterable[str], indent: int) -> typing.Iterator[str]:
+    """
+    Generates _indent(text, indent) for a text given as consecutive chunks,
+    e.g. the blocks read from a file, holding on to one chunk at a time.
+
+    :param chunks: the consecutive parts of the text to be indented
+    :param indent: number of spaces to indent this element
+    :return: iterator over consecutive parts of the indented text
+    """
+    prefix = _prefix(indent)
+    pending = ""
+    started = False
+    for chunk in chunks:
+        pending += chunk
+        # Text is only indented up to its last "\n", so that a line, or a
+        # "\r\n" line break, is never split between two chunks.
+        end = pending.rfind("\n")
+        if end == -1:
+            continue
+        if started:
+            yield "\n"
+        yield _indent_piece(pending[:end], prefix)
+        started = True
+        start = end + 1
+        pending = pending[start:]
+    lines = pending.splitlines()
+    if lines:
+        if started:
+            yield "\n"
+        yield "\n".join([prefix + line if line else line for line in lines])
+
+
+def _prefix_chunks(chunks: typing.Iterable[str], prefix: str) -> typing.Iterator[str]:
+    """
+    Prepends each nonempty line of a text given as consecutive chunks with
+    prefix, leaving its line breaks as they are.
+
+    :param chunks: the consecutive parts of the text to be indented
+    :param prefix: the indentation string
+    :return: iterator over consecutive parts of the indented text
+    """
+    width = len(prefix)
+    line_start = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = _indent_text(chunk, prefix)
+        if not line_start and chunk[0] != "\n":
+            # The chunk continues a line which has already been indented.
+            text = text[width:]
+        line_start = chunk[-1] == "\n"
+        yield text
+
+
+def _batched(parts: typing.Iterable[str], size: int = 65536) -> typing.Iterator[str]:
+    """
+    Joins consecutive small strings into strings of about size characters.
+
+    :param parts: the strings to join
+    :param size: number of characters to collect before joining them
+    :return: iterator over the joined strings
+    """
+    batch = []
+    collected = 0
+    for part in parts:
+        batch.append(part)
+        collected += len(part)
+        if collected >= size:
+            yield "".join(batch)
+            batch.clear()
+            collected = 0
+    if batch:
+        yield "".join(batch)
+
+
+class _BaseRstCloth:
+    """
+    Implements RstCloth and CompactRstCloth, which only differ in whether
+    their instances have a __dict__. See RstCloth for the parameters.
     """
 
-    def __init__(self, stream: typing.TextIO = sys.stdout, line_width: int = 72) -> None:
-        self._stream = stream
+    # _profile is only set on instances instrumented for profiling.
+    __slots__ = (
+        "_stream",
+        "_line_width",
+        "_buffer_size",
+        "_buffer",
+        "_buffered",
+        "_cache",
+        "_block_indent",
+        "_owns_stream",
+        "_profile",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        stream: typing.TextIO = sys.stdout,
+        line_width: int = 72,
+        buffer_size: int = None,
+        cache_size: int = None,
+    ) -> None:
+        self._stream = ChunkBuffer() if stream is None else stream
         self._line_width = line_width
+        self._buffer_size = buffer_size
+        self._buffer = None if buffer_size is None else []
+        self._buffered = 0
+        self._cache = None if cache_size is None else FormatCache(cache_size)
+        self._block_indent = 0
+        self._owns_stream = False
+
+    @classmethod
+    def open(
+        cls,
+        path: typing.Union[str, os.PathLike],
+        line_width: int = 72,
+        buffer_size: int = None,
+        cache_size: int = None,
+        compression: str = None,
+        level: int = None,
+        chunk_size: int = COMPRESS_CHUNK_SIZE,
+        encoding: str = "utf-8",
+    ) -> "RstCloth":
+        """
+        Creates an RstCloth writing to a file. Files ending in .gz, .bz2 or
+        .xz are compressed as they are written, see CompressedWriter. The
+        file is complete once the RstCloth is closed, which leaving a with
+        block does::
+
+            with RstCloth.open("snapshot.rst.xz", level=9) as doc:
+                doc.h1("Snapshot")
+
+        :param path: the file to write
+        :param line_width: Maximum length of each ReStructuredText content line.
+        :param buffer_size: if given, content is collected in memory and
+            written to the file in bulk, see RstCloth
+        :param cache_size: if given, formatted elements are memoized, see
+            RstCloth
+        :param compression: "gzip", "bz2", "lzma" or None; inferred from the
+            suffix of path by default
+        :param level: the compression level, see CompressedWriter
+        :param chunk_size: number of characters compressed at a time
+        :param encoding: the encoding of the file
+        :return: the RstCloth writing to the file
+        """
+        if compression is None:
+            compression = compression_for(path)
+        if compression is None:
+            stream = open(path, "w+", encoding=encoding, newline="")
+        else:
+            stream = CompressedWriter(path, compression, level=level, chunk_size=chunk_size, encoding=encoding)
+        cloth = cls(stream, line_width=line_width, buffer_size=buffer_size, cache_size=cache_size)
+        cloth._owns_stream = True
+        return cloth
+
+    def __enter__(self) -> "RstCloth":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._owns_stream:
+            self.close()
+        else:
+            self.flush()
 
     def fill(self, text: str, initial_indent: int = 0, subsequent_indent: int = 0) -> str:
         """
@@ -54,15 +335,65 @@ class RstCloth:
         :param subsequent_indent: subsequent lines indentation size
         :return: wrapped and indented text
         """
-        return textwrap.fill(
-            text=text,
-            width=self._line_width,
-            initial_indent=" " * initial_indent,
-            subsequent_indent=" " * subsequent_indent,
-            expand_tabs=False,
-            break_long_words=False,
-            break_on_hyphens=False,
-        )
+        if self._cache is None:
+            return get_wrapper(self._line_width, initial_indent, subsequent_indent).fill(text)
+        return self._cached(self._fill, text, initial_indent, subsequent_indent)
+
+    def _fill(self, text: str, initial_indent: int, subsequent_indent: int) -> str:
+        """
+        Breaks text parameter into separate lines, bypassing the format cache.
+
+        :param text: input string to be wrapped and indented
+        :param initial_indent: first line indentation size
+        :param subsequent_indent: subsequent lines indentation size
+        :return: wrapped and indented text
+        """
+        return get_wrapper(self._line_width, initial_indent, subsequent_indent).fill(text)
+
+    def _filler(self, initial_indent: int, subsequent_indent: int) -> typing.Callable[[str], str]:
+        """
+        Returns a function filling many paragraphs with the same indentation,
+        for the batch methods. It is the shared wrapper's fill() unless
+        fill() has to go through the format cache or has been overridden.
+
+        :param initial_indent: first line indentation size
+        :param subsequent_indent: subsequent lines indentation size
+        :return: function taking the text to wrap and returning it wrapped
+        """
+        if self._cache is None and type(self).fill is _BaseRstCloth.fill:
+            return get_wrapper(self._line_width, initial_indent, subsequent_indent).fill
+        return functools.partial(self.fill, initial_indent=initial_indent, subsequent_indent=subsequent_indent)
+
+    def _cached(self, render: typing.Callable[..., str], *args) -> str:
+        """
+        Returns render(*args), memoized in the format cache when it is
+        enabled.
+
+        :param render: the method formatting an element
+        :param args: arguments of the method
+        :return: the formatted element
+        """
+        if self._cache is None:
+            return render(*args)
+        key = (render.__name__, self._line_width) + args
+        try:
+            text = self._cache.get(key)
+        except TypeError:
+            # Arguments which can't be hashed, e.g. a list of lists of fields.
+            return render(*args)
+        if text is None:
+            text = render(*args)
+            self._cache.put(key, text)
+        return text
+
+    @property
+    def cache(self) -> typing.Optional[FormatCache]:
+        """
+        Returns the format cache, or None if caching is disabled.
+
+        :return: the cache of formatted elements
+        """
+        return self._cache
 
     def _add(self, content: t_content) -> None:
         """
@@ -70,11 +401,165 @@ class RstCloth:
 
         :param content: the text to write into this element
         """
-
         if isinstance(content, list):
-            self._stream.write("\n".join(content) + "\n")
-        else:
+            content = "\n".join(content)
+        if self._block_indent:
+            content = _indent_text(content, _prefix(self._block_indent))
+
+        if self._buffer is None:
             self._stream.write(content + "\n")
+        else:
+            self._buffer.append(content)
+            self._buffer.append("\n")
+            self._buffered += len(content) + 1
+            if self._buffered >= self._buffer_size:
+                self._flush_buffer()
+
+    def _add_chunks(self, chunks: typing.Iterable[str]) -> None:
+        """
+        Places content given as consecutive strings into output stream,
+        without joining them.
+
+        :param chunks: the parts of the text to write into this element
+        """
+        if self._block_indent:
+            chunks = _prefix_chunks(chunks, _prefix(self._block_indent))
+        if self._buffer is None:
+            write = self._stream.write
+            for chunk in chunks:
+                write(chunk)
+            write("\n")
+        else:
+            for chunk in chunks:
+                self._write(chunk)
+            self._write("\n")
+
+    def _write(self, text: str) -> None:
+        """
+        Places text into output stream as it is, without a trailing newline.
+
+        :param text: the text to write
+        """
+        if self._buffer is None:
+            self._stream.write(text)
+        else:
+            self._buffer.append(text)
+            self._buffered += len(text)
+            if self._buffered >= self._buffer_size:
+                self._flush_buffer()
+
+    @contextlib.contextmanager
+    def fragment(self, store: typing.Any, name: str, inputs: typing.Any = None) -> typing.Iterator[bool]:
+        """
+        Caches the content written within a with block in a fragment store,
+        e.g. a FragmentStore. The fragment is identified by its name, the
+        digest of the inputs it is rendered from and the line width. If it
+        is cached, it is written from the store and the context manager
+        returns True, so that the block can skip rendering it::
+
+            with doc.fragment(store, "changelog", releases) as cached:
+                if not cached:
+                    doc.h2("Changelog")
+                    ...
+
+        :param store: the store to look the fragment up in and save it to
+        :param name: the name of the fragment
+        :param inputs: the data the fragment is rendered from; JSON
+            serializable values, or values with a stable repr()
+        :return: context manager returning whether the fragment was cached
+        """
+        key = store.key(name, inputs, self._line_width, self._block_indent)
+        text = store.get(key)
+        if text is not None:
+            self._write(text)
+            yield True
+            return
+        # Content is captured unbuffered, leaving anything already buffered
+        # pending in front of it.
+        stream, buffer, buffered = self._stream, self._buffer, self._buffered
+        capture = self._stream = ChunkBuffer()
+        self._buffer = None
+        try:
+            yield False
+        finally:
+            self._stream, self._buffer, self._buffered = stream, buffer, buffered
+        text = capture.getvalue()
+        store.put(key, text)
+        self._write(text)
+
+    @contextlib.contextmanager
+    def block(self, indent: int = 3) -> typing.Iterator[None]:
+        """
+        Indents everything written within a with block, e.g. the content of a
+        list item, by indent more spaces. Elements are formatted for the
+        line width left over by the indentation and written indented straight
+        to the output stream, so nested content needn't be rendered apart and
+        passed back in. Blocks can be nested::
+
+            doc.li("first item")
+            with doc.block(indent=2):
+                doc.content("more about the first item")
+                doc.codeblock(example)
+
+        :param indent: number of spaces to indent the content
+        :return: context manager indenting the content written within it
+        """
+        self._block_indent += indent
+        self._line_width -= indent
+        try:
+            yield
+        finally:
+            self._block_indent -= indent
+            self._line_width += indent
+
+    @contextlib.contextmanager
+    def directive_block(
+        self, name: str, arg: str = None, fields: t_fields = None, indent: int = 0
+    ) -> typing.Iterator[None]:
+        """
+        Constructs reStructuredText directive whose content is written within
+        a with block::
+
+            with doc.directive_block("note"):
+                doc.content("the content of the note")
+                doc.li("with a list")
+
+        :param name: the directive itself to use
+        :param arg: the argument to pass into the directive
+        :param fields: fields to append as children underneath the directive
+        :param indent: number of spaces to indent this element
+        :return: context manager indenting the content written within it
+        """
+        self.directive(name, arg=arg, fields=fields, indent=indent)
+        self.newline()
+        with self.block(indent + 3):
+            yield
+        self.newline()
+
+    def _flush_buffer(self) -> None:
+        """
+        Writes pending buffered content into output stream with a single write.
+        """
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def flush(self) -> None:
+        """
+        Writes any buffered content into output stream and flushes it.
+        """
+        self._flush_buffer()
+        flush = getattr(self._stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def close(self) -> None:
+        """
+        Writes any buffered content into output stream and closes it.
+        """
+        self.flush()
+        self._stream.close()
 
     @property
     def data(self) -> str:
@@ -83,8 +568,53 @@ class RstCloth:
 
         :return: the content of output stream
         """
-        self._stream.seek(0)
-        return self._stream.read()
+        self._flush_buffer()
+        getvalue = getattr(self._stream, "getvalue", None)
+        if getvalue is not None:
+            return getvalue()
+        return self.data_since(0)
+
+    def mark(self) -> int:
+        """
+        Returns the current position in the document, for use with
+        data_since().
+
+        :return: the position of the next content written
+        """
+        self._flush_buffer()
+        return self._stream.tell()
+
+    def data_since(self, mark: int) -> str:
+        """
+        Returns ReStructuredText document content written since a mark,
+        without reading what comes before it and without moving the write
+        position of the output stream.
+
+        :param mark: a position returned by mark()
+        :return: the content of output stream after mark
+        """
+        self._flush_buffer()
+        stream = self._stream
+        if isinstance(stream, (ChunkBuffer, CompressedWriter)):
+            return stream.getvalue(mark)
+        position = stream.tell()
+        stream.seek(mark)
+        try:
+            return stream.read()
+        finally:
+            stream.seek(position)
+
+    def getbuffer(self, encoding: str = "utf-8") -> memoryview:
+        """
+        Returns ReStructuredText document content encoded as bytes.
+
+        :param encoding: the encoding of the content
+        :return: a view of the encoded content of output stream
+        """
+        self._flush_buffer()
+        if isinstance(self._stream, ChunkBuffer):
+            return self._stream.getbuffer(encoding)
+        return memoryview(self.data.encode(encoding))
 
     def newline(self, count: int = 1) -> None:
         """
@@ -108,8 +638,17 @@ class RstCloth:
         :param indent: number of spaces to indent this element
         """
 
-        t = tabulate(tabular_data=data, headers=header, tablefmt="grid", disable_numparse=True)
-        self._add("\n" + _indent(t, indent) + "\n")
+        lines = tables.grid_table(header, data, indent=indent)
+        if lines is None:
+            # Tables the built-in engine can't lay out identically, such as
+            # ones with wide characters or ANSI escapes, are left to tabulate,
+            # which is only imported when needed.
+            from tabulate import tabulate
+
+            t = _indent(tabulate(tabular_data=data, headers=header, tablefmt="grid", disable_numparse=True), indent)
+        else:
+            t = "\n".join(lines)
+        self._add("\n" + t + "\n")
 
     def simple_table(self, header: typing.List, data: t_optional_2d_array, indent=0) -> None:
         """
@@ -121,13 +660,69 @@ class RstCloth:
         :param indent: number of spaces to indent this element
         """
 
-        t = tabulate(tabular_data=data, headers=header, tablefmt="rst", disable_numparse=True)
-        self._add("\n" + _indent(t, indent) + "\n")
+        lines = tables.simple_table(header, data, indent=indent)
+        if lines is None:
+            # Tables the built-in engine can't lay out identically, such as
+            # ones with wide characters or ANSI escapes, are left to tabulate,
+            # which is only imported when needed.
+            from tabulate import tabulate
+
+            t = _indent(tabulate(tabular_data=data, headers=header, tablefmt="rst", disable_numparse=True), indent)
+        else:
+            t = "\n".join(lines)
+        self._add("\n" + t + "\n")
+
+    def spooled_table(self, header: typing.List, rows: t_rows, indent: int = 0) -> None:
+        """
+        Constructs grid table from any iterable of rows without holding them
+        in memory. Rows are spooled to a temporary file while the column
+        widths are measured, then read back and written out line by line.
+        Unlike table(), every row must have as many cells as the header and
+        cell widths are always measured with len().
+
+        :param header: a list of header values (strings), to use for the table
+        :param rows: any iterable of lists of row data (same length as the
+            header list each), e.g. a database cursor or a csv.reader
+        :param indent: number of spaces to indent this element
+        """
+        self._add_table_lines(tables.spooled_lines(header, rows, indent=indent))
+
+    def spooled_simple_table(self, header: typing.List, rows: t_rows, indent: int = 0) -> None:
+        """
+        Constructs a simple grid table from any iterable of rows without
+        holding them in memory, like spooled_table().
+
+        :param header: a list of header values (strings), to use for the table
+        :param rows: any iterable of lists of row data (same length as the
+            header list each), e.g. a database cursor or a csv.reader
+        :param indent: number of spaces to indent this element
+        """
+        self._add_table_lines(tables.spooled_lines(header, rows, indent=indent, simple=True))
+
+    def _add_table_lines(self, lines: typing.Iterable[str]) -> None:
+        """
+        Places table lines into output stream a batch at a time, framed by
+        blank lines like table() output.
+
+        :param lines: iterator over the lines of the table
+        """
+        # The first batch is taken before anything is written, so that rows
+        # rejected while the table is measured leave no partial output.
+        batches = iter(lambda: list(itertools.islice(lines, 1024)), [])
+        first = next(batches, [])
+        self._add("")
+        if first:
+            self._add(first)
+            for batch in batches:
+                self._add(batch)
+        else:
+            self._add("")
+        self._add("")
 
     def table_list(
         self,
         headers: typing.Iterable,
-        data: t_optional_2d_array,
+        data: t_rows,
         widths: t_widths = None,
         width: t_width = None,
         indent: int = 0,
@@ -136,8 +731,9 @@ class RstCloth:
         Constructs list table.
 
         :param headers: a list of header values (strings), to use for the table
-        :param data: a list of lists of row data (same length as the header
-            list each)
+        :param data: a list, or any other iterable (e.g. a generator), of
+            lists of row data (same length as the header list each); rows
+            are rendered as they are consumed
         :param widths: list of relative column widths or the special
             value "auto"
         :param width: forces the width of the table to the specified
@@ -148,7 +744,7 @@ class RstCloth:
         rows = []
         if headers:
             fields.append(("header-rows", "1"))
-            rows.extend([headers])
+            rows.append(headers)
         if widths is not None:
             if not isinstance(widths, str):
                 widths = " ".join(map(str, widths))
@@ -160,54 +756,115 @@ class RstCloth:
         self.newline()
 
         if data:
-            rows.extend(data)
-        for row in rows:
-            self.li(row[0], bullet="* -", indent=indent + 3)
-            for cell in row[1:]:
-                self.li(cell, bullet="  -", indent=indent + 3)
+            rows = itertools.chain(rows, data)
+        self._list_table_rows(rows, indent=indent + 3)
         self.newline()
 
+    def _list_table_rows(self, rows: typing.Iterable[typing.Iterable], indent: int = 0) -> None:
+        """
+        Places list table rows into output stream, one write per row. The
+        output is the same as calling li() for every cell, but the fill
+        function is looked up once per table.
+
+        :param rows: an iterable of lists of row data
+        :param indent: number of spaces to indent the rows
+        """
+        # Both bullets ("* - " and "  - ") are four characters long.
+        fill = self._filler(indent, indent + 4)
+        for row in rows:
+            lines = []
+            bullet = "* - "
+            for cell in row:
+                if isinstance(cell, list):
+                    lines.append(self.fill(bullet + "\n".join(cell), indent, 2 * indent + 4))
+                else:
+                    lines.append(fill(bullet + cell))
+                bullet = "  - "
+            self._add(lines)
+
     def directive(
-        self, name: str, arg: str = None, fields: t_fields = None, content: t_content = None, indent: int = 0
+        self, name: str, arg: str = None, fields: t_fields = None, content: t_source = None, indent: int = 0
     ) -> None:
         """
         Constructs reStructuredText directive.
 
+        :param name: the directive itself to use
+        :param arg: the argument to pass into the directive
+        :param fields: fields to append as children underneath the directive
+        :param content: the text to write into this element; a string, a list
+            or iterator of lines, an os.PathLike path (e.g. a pathlib.Path,
+            not a str) of a UTF-8 text file, or a text file object whose
+            lines are written a chunk at a time
+        :param indent: number of spaces to indent this element
+        """
+        if isinstance(content, os.PathLike):
+            with open(content, encoding="utf-8") as f:
+                self.directive(name, arg=arg, fields=fields, content=f, indent=indent)
+            return
+        if fields is not None:
+            fields = tuple(fields)
+        if content is None or isinstance(content, (str, list, tuple)):
+            if content is not None and not isinstance(content, str):
+                content = tuple(content)
+            self._add(self._cached(self._format_directive, name, arg, fields, content, indent))
+        else:
+            # Content streamed from a file or an iterator is formatted line
+            # by line and never cached.
+            self._add(self._cached(self._format_directive, name, arg, fields, None, indent))
+            self._add_chunks(_batched(self._iter_directive_content(content, indent + 3)))
+
+    def _iter_directive_content(self, lines: typing.Iterable[str], indent: int) -> typing.Iterator[str]:
+        """
+        Generates the content of a directive the way _format_directive formats
+        a list of lines, following the directive's arguments and fields.
+
+        :param lines: the lines of content to write into the directive
+        :param indent: number of spaces to indent the content
+        :return: iterator over the formatted lines, each after a "\n"
+        """
+        for line in lines:
+            yield "\n"
+            yield self._format_content(line, indent)
+        yield "\n"
+
+    def _format_directive(self, name: str, arg: str, fields: t_fields, content: t_content, indent: int) -> str:
+        """
+        Formats reStructuredText directive.
+
         :param name: the directive itself to use
         :param arg: the argument to pass into the directive
         :param fields: fields to append as children underneath the directive
         :param content: the text to write into this element
         :param indent: number of spaces to indent this element
+        :return: the formatted directive
         """
         if arg is None:
             marker = ".. {type}::".format(type=name)
-            self._add(_indent(marker, indent))
+            lines = [_indent(marker, indent)]
         else:
-            first_whitespace = first_whitespace_position(arg)
             # If directive itself is too long to be fitted in a line or
             # directive with an argument can't be wrapped without breaking
             # the directive in half then it is better to exceed the line width
             # limitation.
-            if len(name) + first_whitespace + indent + 6 > self._line_width:
+            if not first_word_fits(arg, self._line_width - len(name) - indent - 6):
                 marker = ".. {type}::".format(type=name)
-                self._add(_indent(marker, indent))
-                self.content(arg, indent=indent + 3)
+                lines = [_indent(marker, indent), self._format_content(arg, indent + 3)]
             else:
                 marker = ".. {type}:: {argument}".format(type=name, argument=arg)
-                result = self.fill(marker, initial_indent=indent, subsequent_indent=indent + 3)
-                self._add(result)
+                lines = [self.fill(marker, initial_indent=indent, subsequent_indent=indent + 3)]
 
         if fields is not None:
             for k, v in fields:
-                self.field(name=k, value=v, indent=indent + 3)
+                lines.append(self._format_field(k, v, indent + 3))
 
         if content is not None:
             if isinstance(content, str):
                 content = [content]
-            self.newline()
+            lines.append("")
             for line in content:
-                self.content(line, indent=indent + 3)
-            self.newline()
+                lines.append(self._format_content(line, indent + 3))
+            lines.append("")
+        return "\n".join(lines)
 
     @classmethod
     def role(cls, name: t_content, value: str, text: str = None) -> str:
@@ -292,22 +949,69 @@ class RstCloth:
         output = ".. |{0}| replace:: {1}".format(name, value)
         self._add(_indent(output, indent))
 
-    def codeblock(self, content: t_content, indent: int = 0, language: str = None) -> None:
+    def codeblock(self, content: t_source, indent: int = 0, language: str = None) -> None:
         """
-        Constructs literal block.
-
-        :param content: the text to write into this element
+        Constructs literal block. Content given as a file path, a file object
+        or an iterator of lines is indented and written a chunk at a time, so
+        that files of any size are embedded in constant memory.
+
+        :param content: the text to write into this element; a string, a list
+            or iterator of lines, an os.PathLike path (e.g. a pathlib.Path,
+            not a str) of a UTF-8 text file, or a text file object to read to
+            its end
         :param indent: number of spaces to indent this element
         :param language: formal language indication for syntax
             highlighter
         :return: literal block
         """
+        if isinstance(content, os.PathLike):
+            with open(content, encoding="utf-8") as f:
+                self.codeblock(f, indent=indent, language=language)
+            return
         if language is None:
             self._add(self.fill("::", initial_indent=indent))
         else:
             self.directive(name="code-block", arg=language, indent=indent)
             self.newline()
-        self._add(_indent(content, indent + 3))
+        if hasattr(content, "read"):
+            chunks = iter(functools.partial(content.read, INDENT_CHUNK_SIZE), "")
+            self._add_chunks(_iter_indent_text(chunks, indent + 3))
+        elif isinstance(content, (str, list, tuple)):
+            if len(content) > INDENT_CHUNK_SIZE:
+                self._add_chunks(_iter_indent(content, indent + 3))
+            else:
+                self._add(_indent(content, indent + 3))
+        else:
+            self._add_chunks(_iter_indent(content, indent + 3))
+
+    def literal_include(
+        self,
+        path: typing.Union[str, os.PathLike],
+        start: int = None,
+        end: int = None,
+        indent: int = 0,
+        language: str = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        Constructs literal block from a range of lines of a file. The file is
+        memory mapped and its line offsets are cached until it changes, so
+        that including a few lines of a huge file reads and decodes only
+        those lines.
+
+        :param path: the file to include
+        :param start: the first line to include, counting from 1; defaults to
+            the first line of the file
+        :param end: the last line to include; defaults to the last line of the
+            file
+        :param indent: number of spaces to indent this element
+        :param language: formal language indication for syntax
+            highlighter
+        :param encoding: the encoding of the file
+        """
+        from rstcloth.include import read_lines
+
+        self.codeblock(read_lines(path, start, end, encoding=encoding), indent=indent, language=language)
 
     def footnote(self, ref: str, text: str, indent: int = 0) -> None:
         """
@@ -334,6 +1038,26 @@ class RstCloth:
         self._add(self.fill(name, indent, indent))
         self._add(self.fill(text, indent + 3, indent + 3))
 
+    def definitions(self, items: typing.Iterable[typing.Tuple[str, str]], indent: int = 0, bold: bool = False) -> None:
+        """
+        Constructs many definition list items with a single write. The output
+        is the same as calling definition() for each item.
+
+        :param items: the name and the text of each definition
+        :param indent: number of spaces to indent this element
+        :param bold: should definition names be bolded
+        """
+        fill_name = self._filler(indent, indent)
+        fill_text = self._filler(indent + 3, indent + 3)
+        lines = []
+        for name, text in items:
+            if bold is True:
+                name = self.bold(name)
+            lines.append(fill_name(name))
+            lines.append(fill_text(text))
+        if lines:
+            self._add(lines)
+
     def li(self, content: t_content, bullet: str = "-", indent: int = 0) -> None:
         """
         Constructs bullet list item.
@@ -352,6 +1076,30 @@ class RstCloth:
         else:
             self._add(self.fill(bullet + content, indent, hanging_indent_len))
 
+    def li_many(self, items: typing.Iterable[t_content], bullet: str = "-", indent: int = 0) -> None:
+        """
+        Constructs many bullet list items with a single write. The output is
+        the same as calling li() for each item.
+
+        :param items: the text of each list item
+        :param bullet: the character of the bullets
+        :param indent: number of spaces to indent this element
+        """
+        bullet += " "
+        hanging_indent_len = indent + len(bullet)
+        fill = self._filler(indent, hanging_indent_len)
+        fill_list = None
+        lines = []
+        for content in items:
+            if isinstance(content, list):
+                if fill_list is None:
+                    fill_list = self._filler(indent, indent + hanging_indent_len)
+                lines.append(fill_list(bullet + "\n".join(content)))
+            else:
+                lines.append(fill(bullet + content))
+        if lines:
+            self._add(lines)
+
     def field(self, name: str, value: str, indent: int = 0) -> None:
         """
         Constructs a field.
@@ -360,15 +1108,35 @@ class RstCloth:
         :param value: the value of the field
         :param indent: number of spaces to indent this element
         """
-        first_whitespace = first_whitespace_position(value)
-        if len(name) + first_whitespace + indent + 3 > self._line_width:
+        self._add(self._cached(self._format_field, name, value, indent))
+
+    def field_many(self, fields: typing.Iterable[typing.Tuple[str, str]], indent: int = 0) -> None:
+        """
+        Constructs many fields with a single write. The output is the same as
+        calling field() for each field.
+
+        :param fields: the name and the value of each field
+        :param indent: number of spaces to indent this element
+        """
+        lines = [self._cached(self._format_field, name, value, indent) for name, value in fields]
+        if lines:
+            self._add(lines)
+
+    def _format_field(self, name: str, value: str, indent: int) -> str:
+        """
+        Formats a field.
+
+        :param name: the name of the field
+        :param value: the value of the field
+        :param indent: number of spaces to indent this element
+        :return: the formatted field
+        """
+        if not first_word_fits(value, self._line_width - len(name) - indent - 3):
             marker = ":{name}:".format(name=name)
-            self._add(_indent(marker, indent))
-            self.content(value, indent=indent + 3)
+            return _indent(marker, indent) + "\n" + self._format_content(value, indent + 3)
         else:
             marker = ":{name}: {value}".format(name=name, value=value)
-            result = self.fill(marker, initial_indent=indent, subsequent_indent=indent + 3)
-            self._add(result)
+            return self.fill(marker, initial_indent=indent, subsequent_indent=indent + 3)
 
     def ref_target(self, name: str, indent: int = 0) -> None:
         """
@@ -387,9 +1155,32 @@ class RstCloth:
         :param content: the text to write into this element
         :param indent: number of spaces to indent this element
         """
+        self._add(self._format_content(content, indent))
+
+    def content_many(self, paragraphs: typing.Iterable[t_content], indent: int = 0) -> None:
+        """
+        Constructs many paragraphs with a single write. The output is the same
+        as calling content() for each paragraph.
+
+        :param paragraphs: the text of each paragraph
+        :param indent: number of spaces to indent this element
+        """
+        fill = self._filler(indent, indent)
+        lines = [fill(" ".join(content) if isinstance(content, list) else content) for content in paragraphs]
+        if lines:
+            self._add(lines)
+
+    def _format_content(self, content: t_content, indent: int) -> str:
+        """
+        Formats paragraph's content.
+
+        :param content: the text to write into this element
+        :param indent: number of spaces to indent this element
+        :return: the wrapped paragraph
+        """
         if isinstance(content, list):
             content = " ".join(content)
-        self._add(self.fill(content, indent, indent))
+        return self.fill(content, indent, indent)
 
     def heading(self, text: str, char: str, overline: bool = False, indent: int = 0) -> None:
         """
@@ -498,3 +1289,40 @@ class RstCloth:
         Constructs transition marker.
         """
         self._add("\n---------\n")
+
+
+class RstCloth(_BaseRstCloth):
+    """
+    RstCloth is the base class to create a ReStructuredText document
+    programmatically.
+
+    :param stream: output stream for writing ReStructuredText content, or
+        None to keep the content in an in-memory ChunkBuffer
+    :param line_width: Maximum length of each ReStructuredText content line.
+        In some edge cases this limit might be crossed.
+    :param buffer_size: if given, content is collected in memory and written
+        to the output stream in bulk once at least this many characters are
+        pending, or on flush(), close() or context manager exit.
+    :param cache_size: if given, fill(), field() and directive() output is
+        memoized in a least-recently-used cache holding this many entries.
+    """
+
+
+class CompactRstCloth(_BaseRstCloth):
+    """
+    CompactRstCloth is an RstCloth whose instances have no __dict__, which
+    makes them smaller and quicker to create, e.g. for the many short-lived
+    instances rendering fragments. Attributes other than its own can't be
+    set on an instance, nor its methods patched. Subclasses which don't
+    declare __slots__ get a __dict__ back.
+
+    :param stream: output stream for writing ReStructuredText content, or
+        None to keep the content in an in-memory ChunkBuffer
+    :param line_width: Maximum length of each ReStructuredText content line.
+    :param buffer_size: if given, content is collected in memory and written
+        to the output stream in bulk, see RstCloth
+    :param cache_size: if given, formatted elements are memoized, see
+        RstCloth
+    """
+
+    __slots__ = ()
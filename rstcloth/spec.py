@@ -0,0 +1,167 @@
+import functools
+import inspect
+import os
+import typing
+import yaml
+
+from rstcloth.document import Node, _is_element
+from rstcloth.rstcloth import RstCloth
+
+
+try:
+    Loader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    Loader = yaml.SafeLoader
+
+t_spec = typing.Union[str, bytes, os.PathLike, typing.IO]
+
+
+class SpecError(ValueError):
+    """
+    Raised for a spec node which doesn't describe an RstCloth element call.
+    """
+
+
+def _compose(loader: yaml.SafeLoader, anchors: dict) -> yaml.Node:
+    """
+    Builds the node of the next value of a YAML stream from its events.
+    This does what yaml.composer.Composer does, which the libyaml loader
+    doesn't expose for anything smaller than a whole document.
+
+    :param loader: a loader positioned at the start of the value
+    :param anchors: the anchored nodes of the current document
+    :return: the node of the value
+    """
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.composer.ComposerError(
+                None, None, "found undefined alias {0!r}".format(event.anchor), event.start_mark
+            )
+        return anchors[event.anchor]
+    tag = None if event.tag == "!" else event.tag
+    if isinstance(event, yaml.ScalarEvent):
+        tag = tag or loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, yaml.SequenceStartEvent):
+        tag = tag or loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+    else:
+        tag = tag or loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    if isinstance(node, yaml.SequenceNode):
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose(loader, anchors))
+    elif isinstance(node, yaml.MappingNode):
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = _compose(loader, anchors)
+            node.value.append((key, _compose(loader, anchors)))
+    else:
+        return node
+    node.end_mark = loader.get_event().end_mark
+    return node
+
+
+@functools.lru_cache(maxsize=None)
+def _argument_name(name: str) -> typing.Optional[str]:
+    """
+    Checks that name is an element method, and finds the parameter a single
+    argument of the element is passed as. The shorthands made with
+    functools.partialmethod, e.g. note or author, bind their first parameter
+    by keyword, so their arguments have to be passed by keyword too.
+
+    :param name: the name of an RstCloth element method
+    :return: the name of the first parameter left free by a shorthand, or
+        None if the argument can be passed positionally
+    """
+    if not hasattr(RstCloth, name) or not _is_element(RstCloth, name):
+        raise SpecError("{0!r} is not a document element".format(name))
+    attribute = inspect.getattr_static(RstCloth, name)
+    if not isinstance(attribute, functools.partialmethod):
+        return None
+    parameters = list(inspect.signature(attribute.func).parameters)[1:]
+    return next(parameter for parameter in parameters if parameter not in attribute.keywords)
+
+
+def _node(data: typing.Any, mark: yaml.Mark) -> Node:
+    """
+    Converts one item of a spec into an element call.
+
+    :param data: the item, a mapping of a single RstCloth method name to
+        its arguments
+    :param mark: the position of the item in the spec, for error messages
+    :return: the element call
+    """
+    if not isinstance(data, dict) or len(data) != 1:
+        raise SpecError("Expected a mapping of one element to its arguments {0}".format(mark))
+    ((name, arguments),) = data.items()
+    if not isinstance(name, str):
+        raise SpecError("{0!r} is not a document element {1}".format(name, mark))
+    try:
+        keyword = _argument_name(name)
+    except SpecError as error:
+        raise SpecError("{0} {1}".format(error, mark)) from None
+    if arguments is None:
+        return Node(name, (), {})
+    if isinstance(arguments, dict):
+        return Node(name, (), arguments)
+    if keyword is not None:
+        return Node(name, (), {keyword: arguments})
+    return Node(name, (arguments,), {})
+
+
+def iter_spec(spec: t_spec) -> typing.Iterator[Node]:
+    """
+    Parses a YAML (or JSON, which YAML parsers read too) document spec one
+    element at a time, so that only the element being rendered is held in
+    memory. A spec is a list of elements, each a mapping of one RstCloth
+    method name to its arguments, e.g. ``- h2: Title`` or
+    ``- table: {header: [a, b], data: [[1, 2]]}``. A mapping of arguments is
+    passed as keyword arguments, null as no arguments, and anything else as
+    the first argument. A stream may hold several such lists, as
+    separate YAML documents; empty or null documents hold no elements.
+
+    :param spec: the spec, as a path-like object, text, bytes or a file object
+    :return: iterator over the element calls of the spec
+    """
+    if isinstance(spec, os.PathLike):
+        with open(spec, "rb") as f:
+            yield from iter_spec(f)
+        return
+    loader = Loader(spec)
+    try:
+        loader.get_event()
+        while loader.check_event(yaml.DocumentStartEvent):
+            loader.get_event()
+            if loader.check_event(yaml.SequenceStartEvent):
+                anchors = {}
+                loader.get_event()
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    node = _compose(loader, anchors)
+                    yield _node(loader.construct_document(node), node.start_mark)
+                loader.get_event()
+            elif not loader.check_event(yaml.DocumentEndEvent):
+                # An empty document, e.g. after a trailing ---, holds null.
+                node = _compose(loader, {})
+                if not isinstance(node, yaml.ScalarNode) or loader.construct_document(node) is not None:
+                    raise SpecError("Expected a list of elements {0}".format(node.start_mark))
+            loader.get_event()
+    finally:
+        loader.dispose()
+
+
+def render_spec(spec: t_spec, cloth: RstCloth) -> int:
+    """
+    Renders a document spec into an RstCloth, as it is parsed.
+
+    :param spec: the spec, as a path-like object, text, bytes or a file object
+    :param cloth: the RstCloth to write the elements into
+    :return: the number of elements rendered
+    """
+    count = 0
+    for node in iter_spec(spec):
+        node.render(cloth)
+        count += 1
+    return count
@@ -0,0 +1,282 @@
+import re
+import typing
+
+
+# Cells made only of printable ASCII characters and newlines are laid out
+# exactly as tabulate lays them out. Anything else (tabs, carriage returns,
+# ANSI escape sequences, wide characters...) is measured differently by
+# tabulate, so tables containing it are left to tabulate.
+_unsupported = re.compile(r"[^\x20-\x7e\n]").search
+
+# Spooled rows are kept in memory up to this many characters, then moved to
+# a temporary file on disk.
+SPOOL_SIZE = 1024 * 1024
+
+
+class TableLayout:
+    """
+    Collects the cell text and column widths of a table one row at a time,
+    so that a table can be measured in a single pass over its rows and then
+    emitted with grid_lines() or simple_lines().
+
+    :param header: a list of header values (strings), to use for the table
+    :param escape_first_column: replace blank values in the first column
+        with ".." (needed by simple tables, where an empty first cell would
+        continue the previous row)
+    """
+
+    __slots__ = ("header", "widths", "rows", "multiline", "exact", "_escape_first_column")
+
+    def __init__(self, header: typing.Iterable, escape_first_column: bool = False) -> None:
+        self.header = [str(value) for value in header]
+        self.rows = 0
+        self.multiline = False
+        self.exact = True
+        self._escape_first_column = escape_first_column
+        if self.header and escape_first_column and not self.header[0].strip():
+            self.header[0] = ".."
+        self.widths = []
+        for text in self.header:
+            self._check(text)
+            self.widths.append(self._width(text) + 2)
+
+    def _check(self, text: str) -> None:
+        """
+        Records whether text is multiline and whether it can be laid out
+        exactly as tabulate would.
+
+        :param text: the unstripped text of a cell
+        """
+        if _unsupported(text) is not None:
+            self.exact = False
+        if "\n" in text:
+            self.multiline = True
+
+    @staticmethod
+    def _width(text: str) -> int:
+        """
+        Returns the width of the widest line of text.
+
+        :param text: the text of a cell
+        :return: width of the cell
+        """
+        if "\n" in text:
+            return max(map(len, text.split("\n")))
+        return len(text)
+
+    def add(self, row: typing.Iterable) -> typing.List[str]:
+        """
+        Formats a row of values and widens the columns to fit it.
+
+        :param row: a list of row data (same length as the header list)
+        :return: text of each cell in the row
+        """
+        cells = []
+        for value in row:
+            if value is None:
+                cells.append("")
+                continue
+            if isinstance(value, bytes):
+                self.exact = False
+            if not cells and self._escape_first_column and isinstance(value, str) and not value.strip():
+                text = ".."
+            else:
+                text = "{0}".format(value)
+                self._check(text)
+            cells.append(text.strip())
+
+        if not self.widths and not self.rows:
+            self.widths = [0] * len(cells)
+        if len(cells) != len(self.widths):
+            raise ValueError("Table row has {0} cells, expected {1}".format(len(cells), len(self.widths)))
+        widths = self.widths
+        for column, text in enumerate(cells):
+            width = self._width(text)
+            if width > widths[column]:
+                widths[column] = width
+        self.rows += 1
+        return cells
+
+    def _row_lines(self, cells: typing.List[str], header: bool = False) -> typing.List[typing.List[str]]:
+        """
+        Splits a row into lines of cells padded to their column widths.
+
+        :param cells: text of each cell in the row
+        :param header: whether the cells are header values
+        :return: a list of physical lines, each a list of padded cells
+        """
+        widths = self.widths
+        if not self.multiline:
+            return [[text.ljust(width) for text, width in zip(cells, widths)]]
+        if header:
+            columns = [text.split("\n") for text in cells]
+        else:
+            columns = [text.split("\n") if text else [] for text in cells]
+        height = max(map(len, columns), default=0)
+        return [
+            [
+                column[index].ljust(width) if index < len(column) else " " * width
+                for column, width in zip(columns, widths)
+            ]
+            for index in range(height)
+        ]
+
+    def grid_lines(self, rows: typing.Iterable[typing.List[str]], indent: int = 0) -> typing.Iterator[str]:
+        """
+        Generates the lines of a grid table.
+
+        :param rows: text of each cell of each row, as returned by add()
+        :param indent: number of spaces to indent this element
+        :return: iterator over the lines of the table
+        """
+        if not self.header and not self.rows:
+            return
+        prefix = " " * indent
+        rule = prefix + "+" + "+".join("-" * (width + 2) for width in self.widths) + "+"
+
+        yield rule
+        if self.header:
+            for line in self._row_lines(self.header, header=True):
+                yield prefix + "| " + " | ".join(line) + " |"
+            yield prefix + "+" + "+".join("=" * (width + 2) for width in self.widths) + "+"
+        for index, cells in enumerate(rows):
+            if index:
+                yield rule
+            for line in self._row_lines(cells):
+                yield prefix + "| " + " | ".join(line) + " |"
+        yield rule
+
+    def simple_lines(self, rows: typing.Iterable[typing.List[str]], indent: int = 0) -> typing.Iterator[str]:
+        """
+        Generates the lines of a simple table.
+
+        :param rows: text of each cell of each row, as returned by add()
+        :param indent: number of spaces to indent this element
+        :return: iterator over the lines of the table
+        """
+        if not self.header and not self.rows:
+            return
+        prefix = " " * indent
+        rule = prefix + "  ".join("=" * width for width in self.widths).rstrip()
+
+        yield rule
+        if self.header:
+            for line in self._row_lines(self.header, header=True):
+                line = "  ".join(line).rstrip()
+                yield prefix + line if line else line
+            yield rule
+        for cells in rows:
+            for line in self._row_lines(cells):
+                line = "  ".join(line).rstrip()
+                # Rows of empty cells are left blank rather than indented.
+                yield prefix + line if line else line
+        yield rule
+
+
+def _layout(
+    header: typing.List, data: typing.Optional[typing.List[typing.List]], escape_first_column: bool
+) -> typing.Optional[typing.Tuple[TableLayout, typing.List[typing.List[str]]]]:
+    """
+    Measures a table held in memory.
+
+    :param header: a list of header values (strings), to use for the table
+    :param data: a list of lists of row data (same length as the header
+        list each)
+    :param escape_first_column: replace blank values in the first column
+        with ".."
+    :return: the table layout and the text of its rows, or None if the table
+        can't be laid out exactly as tabulate would lay it out
+    """
+    if data is None:
+        data = []
+    if not isinstance(header, (list, tuple)) or not isinstance(data, (list, tuple)):
+        return None
+    layout = TableLayout(header, escape_first_column=escape_first_column)
+    rows = []
+    for row in data:
+        if not isinstance(row, (list, tuple)):
+            return None
+        try:
+            rows.append(layout.add(row))
+        except ValueError:
+            return None
+        if not layout.exact:
+            return None
+    # A table whose columns are all empty would consist of blank lines only.
+    if not layout.exact or not any(layout.widths):
+        return None
+    return layout, rows
+
+
+def grid_table(
+    header: typing.List, data: typing.Optional[typing.List[typing.List]], indent: int = 0
+) -> typing.Optional[typing.List[str]]:
+    """
+    Lays out a grid table the way ``tabulate(..., tablefmt="grid",
+    disable_numparse=True)`` does.
+
+    :param header: a list of header values (strings), to use for the table
+    :param data: a list of lists of row data (same length as the header
+        list each)
+    :param indent: number of spaces to indent this element
+    :return: the lines of the table, or None if the table has to be left to
+        tabulate
+    """
+    measured = _layout(header, data, escape_first_column=False)
+    if measured is None:
+        return None
+    layout, rows = measured
+    return list(layout.grid_lines(rows, indent=indent))
+
+
+def simple_table(
+    header: typing.List, data: typing.Optional[typing.List[typing.List]], indent: int = 0
+) -> typing.Optional[typing.List[str]]:
+    """
+    Lays out a simple table the way ``tabulate(..., tablefmt="rst",
+    disable_numparse=True)`` does.
+
+    :param header: a list of header values (strings), to use for the table
+    :param data: a list of lists of row data (same length as the header
+        list each)
+    :param indent: number of spaces to indent this element
+    :return: the lines of the table, or None if the table has to be left to
+        tabulate
+    """
+    measured = _layout(header, data, escape_first_column=True)
+    if measured is None:
+        return None
+    layout, rows = measured
+    return list(layout.simple_lines(rows, indent=indent))
+
+
+def spooled_lines(
+    header: typing.List, rows: typing.Optional[typing.Iterable[typing.Iterable]], indent: int = 0, simple: bool = False
+) -> typing.Iterator[str]:
+    """
+    Lays out a table from any iterable of rows in two passes. The first pass
+    measures the rows and spools their cell text to a temporary file, which
+    stays in memory only while it is small; the second pass reads the rows
+    back one at a time while generating the lines of the table.
+
+    :param header: a list of header values (strings), to use for the table
+    :param rows: any iterable of lists of row data (same length as the
+        header list each), e.g. a database cursor or a csv.reader, or None
+        for no rows
+    :param indent: number of spaces to indent this element
+    :param simple: generate a simple table rather than a grid table
+    :return: iterator over the lines of the table
+    """
+    import json
+    import tempfile
+
+    if rows is None:
+        rows = []
+    layout = TableLayout(header, escape_first_column=simple)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE, mode="w+", encoding="utf-8") as spool:
+        for row in rows:
+            spool.write(json.dumps(layout.add(row)))
+            spool.write("\n")
+        spool.seek(0)
+        lines = layout.simple_lines if simple else layout.grid_lines
+        yield from lines(map(json.loads, spool), indent=indent)
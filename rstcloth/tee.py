@@ -0,0 +1,207 @@
+import io
+import queue
+import threading
+import typing
+
+
+def _is_binary(sink: typing.Any) -> bool:
+    """
+    Tells whether a stream takes bytes rather than text.
+
+    :param sink: a writable stream
+    :return: whether the stream is a binary stream
+    """
+    if isinstance(sink, io.TextIOBase):
+        return False
+    if isinstance(sink, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    mode = getattr(sink, "mode", "")
+    return isinstance(mode, str) and "b" in mode
+
+
+def _drain(chunks: queue.Queue, write: typing.Callable, errors: typing.List[BaseException]) -> None:
+    """
+    Writes the chunks put in a queue until None is put, in a worker thread.
+    After a failed write the remaining chunks are dropped, so that the
+    writing thread never blocks on a full queue.
+
+    :param chunks: the queue of chunks to write
+    :param write: the write() method of a sink or update() method of a hasher
+    :param errors: the list to record a failed write's exception into
+    """
+    while True:
+        chunk = chunks.get()
+        try:
+            if chunk is None:
+                return
+            if not errors:
+                write(chunk)
+        except BaseException as error:
+            errors.append(error)
+        finally:
+            chunks.task_done()
+
+
+class TeeStream:
+    """
+    TeeStream is a write-only text stream passing what is written on to
+    several sinks, e.g. a file, a gzip.GzipFile and a ChunkBuffer, and to
+    incremental hashers such as hashlib.sha256() objects, so that a document
+    is rendered once and written everywhere in a single pass::
+
+        digest = hashlib.sha256()
+        with open("page.rst", "w") as f, gzip.open("page.rst.gz", "wb") as archive:
+            doc = RstCloth(stream=TeeStream([f, archive], hashers=[digest]))
+            ...
+            doc.flush()
+
+    Writes are collected and passed on once at least buffer_size characters
+    are pending, encoded once for all binary sinks and hashers. With
+    threaded=True every sink and hasher is written to by its own thread,
+    through a queue holding up to queue_size chunks, so a slow sink only
+    holds up the others once its queue is full. An exception raised by a
+    sink is raised again by the next write(), flush() or close().
+
+    :param sinks: text or binary streams to write to
+    :param hashers: objects with an update() method taking bytes
+    :param buffer_size: number of pending characters above which they are
+        passed on
+    :param threaded: write to each sink and hasher from a separate thread
+    :param queue_size: number of chunks each thread can fall behind by
+    :param encoding: the encoding of what is passed to binary sinks and
+        hashers
+    """
+
+    __slots__ = (
+        "_sinks",
+        "_writers",
+        "_binary",
+        "_encoding",
+        "_buffer_size",
+        "_buffer",
+        "_buffered",
+        "_position",
+        "_queues",
+        "_threads",
+        "_errors",
+        "closed",
+    )
+
+    def __init__(
+        self,
+        sinks: typing.Iterable[typing.IO],
+        hashers: typing.Iterable[typing.Any] = (),
+        buffer_size: int = 65536,
+        threaded: bool = False,
+        queue_size: int = 16,
+        encoding: str = "utf-8",
+    ) -> None:
+        self._sinks = list(sinks)
+        hashers = list(hashers)
+        self._writers = [sink.write for sink in self._sinks] + [hasher.update for hasher in hashers]
+        self._binary = [_is_binary(sink) for sink in self._sinks] + [True] * len(hashers)
+        self._encoding = encoding
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._position = 0
+        self._queues = None
+        self._threads = []
+        self._errors = []
+        self.closed = False
+        if threaded:
+            self._queues = [queue.Queue(queue_size) for _ in self._writers]
+            for chunks, write in zip(self._queues, self._writers):
+                thread = threading.Thread(target=_drain, args=(chunks, write, self._errors), daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _check(self) -> None:
+        """
+        Raises the exception of a failed write in a worker thread, if any.
+        """
+        if self._errors:
+            raise self._errors[0]
+
+    def _dispatch(self) -> None:
+        """
+        Passes pending text on to every sink and hasher.
+        """
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        data = text.encode(self._encoding) if any(self._binary) else None
+        self._check()
+        for index, write in enumerate(self._writers):
+            chunk = data if self._binary[index] else text
+            if self._queues is None:
+                write(chunk)
+            else:
+                self._queues[index].put(chunk)
+
+    def write(self, text: str) -> int:
+        """
+        Writes text to every sink and hasher.
+
+        :param text: the text to write
+        :return: the number of characters written
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed stream.")
+        if text:
+            self._buffer.append(text)
+            self._buffered += len(text)
+            self._position += len(text)
+            if self._buffered >= self._buffer_size:
+                self._dispatch()
+        return len(text)
+
+    def tell(self) -> int:
+        """
+        Returns the current position, i.e. the number of characters written.
+
+        :return: the position
+        """
+        return self._position
+
+    def flush(self) -> None:
+        """
+        Passes pending text on, waits for the worker threads to write it,
+        and flushes the sinks.
+        """
+        self._dispatch()
+        if self._queues is not None:
+            for chunks in self._queues:
+                chunks.join()
+            self._check()
+        for sink in self._sinks:
+            flush = getattr(sink, "flush", None)
+            if flush is not None:
+                flush()
+
+    def close(self) -> None:
+        """
+        Flushes and closes every sink, and stops the worker threads.
+        """
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.closed = True
+            for chunks, thread in zip(self._queues or (), self._threads):
+                chunks.put(None)
+                thread.join()
+            for sink in self._sinks:
+                sink.close()
+
+    def readable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return False
+
+    def writable(self) -> bool:
+        return True
@@ -1,14 +1,42 @@
-def first_whitespace_position(string: str) -> int:
+import re
+
+
+# In str patterns \s matches exactly the characters for which str.isspace()
+# is true, including non-ASCII whitespace.
+_whitespace = re.compile(r"\s").search
+
+
+def first_whitespace_position(string: str, end: int = None) -> int:
     """
     Finds the first whitespace and return it's position. If there is no
     whitespaces return string's length.
 
     :param string: string to look for whitespaces in
+    :param end: if given, only the first end characters are searched, and
+        end is returned if none of them is a whitespace
     :return: index of the first whitespace within a string
     """
-    counter = -1
-    for character in string:
-        counter += 1
-        if character.isspace():
-            return counter
-    return counter + 1
+    if end is None:
+        end = len(string)
+    elif end <= 0:
+        return 0
+    match = _whitespace(string, 0, end)
+    if match is None:
+        return min(len(string), end)
+    return match.start()
+
+
+def first_word_fits(string: str, width: int) -> bool:
+    """
+    Tells whether the first word of a string is at most width characters
+    long, looking at no more than width + 1 characters.
+
+    :param string: string whose first word is measured
+    :param width: maximum length of the word
+    :return: whether the string's first word fits in width
+    """
+    if width < 0:
+        return False
+    if _whitespace(string, 0, width + 1) is None:
+        return len(string) <= width
+    return True
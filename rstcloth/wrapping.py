@@ -0,0 +1,189 @@
+import bisect
+import functools
+import itertools
+import re
+
+
+# The same whitespace set textwrap uses for splitting and munging, so wrapped
+# output stays byte-identical to textwrap.fill.
+_whitespace = "\t\n\x0b\x0c\r "
+_whitespace_translation = {ord(character): " " for character in _whitespace}
+_split_chunks = re.compile(r"([{0}]+)".format(re.escape(_whitespace))).split
+# Once whitespace has been translated to spaces, text without any other
+# character for which str.isspace() is true can be wrapped by scanning for
+# spaces directly instead of splitting it into chunks.
+_other_whitespace = re.compile(r"[^\x00-\x1b\x20-\x84\x86-\x9f\xa1-\u167f]").search
+_non_space = re.compile(r"[^ ]").search
+
+
+class LineWrapper:
+    """
+    Wraps paragraphs the way ``textwrap.fill`` does when called with
+    ``expand_tabs=False``, ``break_long_words=False`` and
+    ``break_on_hyphens=False``, without building a ``TextWrapper`` per call.
+
+    :param width: maximum length of each wrapped line
+    :param initial_indent: first line indentation size
+    :param subsequent_indent: subsequent lines indentation size
+    """
+
+    __slots__ = ("width", "initial_indent", "subsequent_indent")
+
+    def __init__(self, width: int, initial_indent: int = 0, subsequent_indent: int = 0) -> None:
+        if width <= 0:
+            raise ValueError("invalid width {0!r} (must be > 0)".format(width))
+        self.width = width
+        self.initial_indent = " " * initial_indent
+        self.subsequent_indent = " " * subsequent_indent
+
+    def fill(self, text: str) -> str:
+        """
+        Breaks text parameter into separate lines.
+
+        :param text: input string to be wrapped and indented
+        :return: wrapped and indented text
+        """
+        if not text.isprintable():
+            text = text.translate(_whitespace_translation)
+        # Short-circuit: a paragraph which already fits and has no trailing
+        # whitespace to drop is returned as a single line.
+        if text and len(text) + len(self.initial_indent) <= self.width and not text[-1].isspace():
+            return self.initial_indent + text
+        return "\n".join(self._wrap(text))
+
+    def wrap(self, text: str) -> list:
+        """
+        Breaks text parameter into a list of separate lines.
+
+        :param text: input string to be wrapped and indented
+        :return: list of wrapped and indented lines
+        """
+        return self._wrap(text.translate(_whitespace_translation))
+
+    def _wrap(self, text: str) -> list:
+        """
+        Breaks text, with whitespace already translated to spaces, into a list
+        of separate lines.
+
+        :param text: input string to be wrapped and indented
+        :return: list of wrapped and indented lines
+        """
+        if _other_whitespace(text) is None:
+            return self._wrap_spaces(text)
+        return self._wrap_chunks(text)
+
+    def _wrap_spaces(self, text: str) -> list:
+        """
+        Wraps text whose only whitespace character is the space.
+
+        :param text: input string to be wrapped and indented
+        :return: list of wrapped and indented lines
+        """
+        lines = []
+        position = 0
+        total = len(text)
+        while position < total:
+            indent = self.subsequent_indent if lines else self.initial_indent
+            width = self.width - len(indent)
+            # Whitespace at the start of any line but the first is dropped.
+            if lines and text[position] == " ":
+                match = _non_space(text, position)
+                if match is None:
+                    break
+                position = match.start()
+            limit = position + width
+            if limit >= total:
+                end = total
+            elif width <= 0:
+                end = position
+            elif (text[limit - 1] == " ") != (text[limit] == " "):
+                end = limit
+            elif text[limit] == " ":
+                end = position + len(text[position:limit].rstrip(" "))
+            else:
+                end = text.rfind(" ", position, limit) + 1
+            # A word or whitespace run longer than a whole line is never
+            # broken, so it gets a line of its own.
+            if end <= position:
+                if text[position] == " ":
+                    match = _non_space(text, position)
+                    end = total if match is None else match.start()
+                else:
+                    end = text.find(" ", position)
+                    if end == -1:
+                        end = total
+            line = text[position:end].rstrip(" ")
+            position = end
+            if line:
+                lines.append(indent + line)
+        return lines
+
+    def _wrap_chunks(self, text: str) -> list:
+        """
+        Wraps text chunk by chunk, treating any chunk for which str.isspace()
+        is true as droppable whitespace.
+
+        :param text: input string to be wrapped and indented
+        :return: list of wrapped and indented lines
+        """
+        chunks = _split_chunks(text)
+        # Splitting on a capturing group only produces empty chunks at the
+        # very start and end of the text.
+        if chunks[-1] == "":
+            chunks.pop()
+        if chunks and chunks[0] == "":
+            del chunks[0]
+        # offsets[i] is the combined length of the first i chunks, so the
+        # end of each line can be found by bisection instead of chunk by chunk.
+        offsets = [0]
+        offsets.extend(itertools.accumulate(map(len, chunks)))
+        lines = []
+        position = 0
+        total = len(chunks)
+        while position < total:
+            indent = self.subsequent_indent if lines else self.initial_indent
+            width = self.width - len(indent)
+            # Whitespace at the start of any line but the first is dropped.
+            if lines and chunks[position].strip() == "":
+                position += 1
+                if position == total:
+                    break
+            start = position
+            position = max(bisect.bisect_right(offsets, offsets[start] + width, start) - 1, start)
+            # A chunk longer than a whole line is never broken, so it gets a
+            # line of its own.
+            if position == start:
+                position += 1
+            end = position
+            if chunks[end - 1].strip() == "":
+                end -= 1
+            if end > start:
+                lines.append(indent + "".join(chunks[start:end]))
+        return lines
+
+
+@functools.lru_cache(maxsize=256)
+def get_wrapper(width: int, initial_indent: int = 0, subsequent_indent: int = 0) -> LineWrapper:
+    """
+    Returns a shared LineWrapper for the given width and indentation.
+
+    :param width: maximum length of each wrapped line
+    :param initial_indent: first line indentation size
+    :param subsequent_indent: subsequent lines indentation size
+    :return: reusable line wrapper
+    """
+    return LineWrapper(width, initial_indent, subsequent_indent)
+
+
+def fill(text: str, width: int, initial_indent: int = 0, subsequent_indent: int = 0) -> str:
+    """
+    Breaks text parameter into separate lines. Each line is indented
+    accordingly to initial_indent and subsequent_indent parameters.
+
+    :param text: input string to be wrapped and indented
+    :param width: maximum length of each wrapped line
+    :param initial_indent: first line indentation size
+    :param subsequent_indent: subsequent lines indentation size
+    :return: wrapped and indented text
+    """
+    return get_wrapper(width, initial_indent, subsequent_indent).fill(text)
@@ -0,0 +1,115 @@
+import asyncio
+import io
+import unittest
+
+from rstcloth import RstCloth
+from rstcloth.asynchronous import AsyncRstCloth
+
+
+class Writer:
+    """A stand-in for asyncio.StreamWriter."""
+
+    def __init__(self):
+        self.chunks = []
+        self.drained = 0
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        self.drained += 1
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+class CoroutineWriter:
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, data):
+        self.chunks.append(data)
+
+
+def build(r):
+    r.title("Example")
+    r.content("the " * 30)
+    r.table(["span", "ham"], [[1, 2]])
+
+
+class TestAsyncRstCloth(unittest.TestCase):
+    def expected(self):
+        r = RstCloth(stream=io.StringIO())
+        build(r)
+        return r.data
+
+    def test_stream_writer(self):
+        writer = Writer()
+
+        async def main():
+            async with AsyncRstCloth(writer, buffer_size=8) as r:
+                r.h1("first")
+                # Enough content was buffered to be handed over before drain().
+                self.assertEqual(writer.chunks, [b"first\n=====\n"])
+                build(r)
+
+        asyncio.run(main())
+        self.assertEqual(b"".join(writer.chunks), b"first\n=====\n" + self.expected().encode())
+        self.assertEqual(writer.drained, 1)
+
+    def test_coroutine_writer(self):
+        writer = CoroutineWriter()
+
+        async def main():
+            r = AsyncRstCloth(writer, buffer_size=16, encoding=None)
+            build(r)
+            self.assertEqual(writer.chunks, [])
+            await r.drain()
+
+        asyncio.run(main())
+        self.assertEqual(writer.chunks, [self.expected()])
+
+    def test_aclose(self):
+        writer = Writer()
+
+        async def main():
+            r = AsyncRstCloth(writer)
+            r.li("foo")
+            await r.aclose()
+
+        asyncio.run(main())
+        self.assertEqual(writer.chunks, [b"- foo\n"])
+        self.assertTrue(writer.closed)
+
+    def test_no_data(self):
+        with self.assertRaises(io.UnsupportedOperation):
+            AsyncRstCloth(Writer()).data
+
+    def test_buffer_required(self):
+        for buffer_size in (None, 0):
+            with self.subTest(buffer_size=buffer_size):
+                with self.assertRaises(ValueError):
+                    AsyncRstCloth(Writer(), buffer_size=buffer_size)
+
+    def test_smallest_buffer(self):
+        writer = CoroutineWriter()
+
+        async def main():
+            r = AsyncRstCloth(writer, buffer_size=1)
+            build(r)
+            await r.drain()
+
+        asyncio.run(main())
+        self.assertEqual(b"".join(writer.chunks), self.expected().encode())
+
+    def test_no_open(self):
+        with self.assertRaises(TypeError):
+            AsyncRstCloth.open("page.rst.gz")
+
+
+if __name__ == "__main__":
+    unittest.main()
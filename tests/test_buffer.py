@@ -0,0 +1,45 @@
+import unittest
+
+from rstcloth.buffer import ChunkBuffer
+
+
+class TestChunkBuffer(unittest.TestCase):
+    def test_write_and_tell(self):
+        buffer = ChunkBuffer()
+        self.assertEqual(buffer.write("abc"), 3)
+        self.assertEqual(buffer.write(""), 0)
+        buffer.write("de")
+        self.assertEqual(buffer.tell(), 5)
+        self.assertEqual(len(buffer), 5)
+
+    def test_getvalue(self):
+        buffer = ChunkBuffer()
+        self.assertEqual(buffer.getvalue(), "")
+        for chunk in ("abc", "de", "fghi"):
+            buffer.write(chunk)
+        self.assertEqual(buffer.getvalue(), "abcdefghi")
+        # Joining keeps positions valid for later writes.
+        buffer.write("jk")
+        self.assertEqual(buffer.getvalue(), "abcdefghijk")
+
+    def test_getvalue_from_position(self):
+        buffer = ChunkBuffer()
+        for chunk in ("abc", "de", "fghi"):
+            buffer.write(chunk)
+        text = "abcdefghi"
+        for start in range(len(text) + 2):
+            self.assertEqual(buffer.getvalue(start), text[start:])
+
+    def test_getbuffer(self):
+        buffer = ChunkBuffer()
+        buffer.write("aé")
+        buffer.write("b")
+        self.assertEqual(buffer.getbuffer().tobytes(), "aéb".encode("utf-8"))
+        self.assertEqual(buffer.getbuffer("latin-1").tobytes(), b"a\xe9b")
+
+    def test_closed(self):
+        buffer = ChunkBuffer()
+        buffer.close()
+        self.assertTrue(buffer.closed)
+        with self.assertRaises(ValueError):
+            buffer.write("a")
@@ -0,0 +1,135 @@
+import functools
+import os
+import stat
+import tempfile
+import unittest
+
+from rstcloth import RstDocument
+from rstcloth.build import Manifest, build_documents, write_atomic, write_if_changed
+
+
+def build_page(doc, title):
+    doc.title(title)
+    doc.content("the " * 30)
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def documents(self):
+        spec = RstDocument()
+        spec.h1("spec")
+        documents = {os.path.join(self.directory.name, "spec.rst"): spec}
+        for index in range(4):
+            path = os.path.join(self.directory.name, "pages", "page{0}.rst".format(index))
+            documents[path] = functools.partial(build_page, title="Page {0}".format(index))
+        return documents
+
+    def check(self, results, documents):
+        self.assertEqual([result.path for result in results], list(documents))
+        for result in results:
+            with open(result.path, "rb") as output:
+                self.assertEqual(len(output.read()), result.size)
+            self.assertGreaterEqual(result.seconds, 0)
+        with open(results[1].path) as output:
+            self.assertTrue(output.read().startswith("======\nPage 0\n======\nthe the"))
+
+    def test_build_in_process(self):
+        documents = self.documents()
+        self.check(build_documents(documents, max_workers=1), documents)
+
+    def test_build_in_pool(self):
+        documents = self.documents()
+        self.check(build_documents(documents, max_workers=2, chunksize=2), documents)
+
+    def test_write_atomic_replaces(self):
+        path = os.path.join(self.directory.name, "out.rst")
+        write_atomic(path, b"old")
+        write_atomic(path, b"new")
+        with open(path, "rb") as output:
+            self.assertEqual(output.read(), b"new")
+        self.assertEqual(os.listdir(self.directory.name), ["out.rst"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_write_atomic_mode(self):
+        path = os.path.join(self.directory.name, "out.rst")
+        umask = os.umask(0o022)
+        try:
+            write_atomic(path, b"new")
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o644)
+            os.chmod(path, 0o640)
+            write_atomic(path, b"newer")
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+        finally:
+            os.umask(umask)
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.manifest = os.path.join(self.directory.name, "manifest.json")
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def documents(self, titles):
+        return {
+            self.path("page{0}.rst".format(index)): functools.partial(build_page, title=title)
+            for index, title in enumerate(titles)
+        }
+
+    def age(self, path):
+        # Pretend the file was written long ago, so a rewrite shows in its mtime.
+        os.utime(path, ns=(10**9, 10**9))
+        return os.stat(path).st_mtime_ns
+
+    def test_unchanged_files_untouched(self):
+        results = build_documents(self.documents(["A", "B"]), max_workers=1, manifest=self.manifest)
+        self.assertEqual([result.written for result in results], [True, True])
+        mtimes = [self.age(result.path) for result in results]
+        results = build_documents(self.documents(["A", "C"]), max_workers=2, manifest=self.manifest)
+        self.assertEqual([result.written for result in results], [False, True])
+        self.assertEqual(os.stat(results[0].path).st_mtime_ns, mtimes[0])
+        self.assertNotEqual(os.stat(results[1].path).st_mtime_ns, mtimes[1])
+        with open(results[1].path) as output:
+            self.assertIn("C", output.read())
+
+    def test_manifest(self):
+        build_documents(self.documents(["A"]), max_workers=1, manifest=self.manifest)
+        manifest = Manifest(self.manifest)
+        self.assertEqual(list(manifest.entries), ["page0.rst"])
+        entry = manifest.get(self.path("page0.rst"))
+        self.assertEqual(entry.size, os.stat(self.path("page0.rst")).st_size)
+        # An unchanged build leaves the manifest untouched too.
+        mtime = self.age(self.manifest)
+        build_documents(self.documents(["A"]), max_workers=1, manifest=self.manifest)
+        self.assertEqual(os.stat(self.manifest).st_mtime_ns, mtime)
+
+    def test_write_if_changed(self):
+        path = self.path("out.rst")
+        written, entry = write_if_changed(path, b"content")
+        self.assertTrue(written)
+        mtime = self.age(path)
+        # Without a matching manifest entry the file content is compared.
+        written, entry = write_if_changed(path, b"content", entry)
+        self.assertFalse(written)
+        self.assertEqual(entry.mtime_ns, mtime)
+        self.assertFalse(write_if_changed(path, b"content", entry)[0])
+        self.assertTrue(write_if_changed(path, b"changed", entry)[0])
+        self.assertTrue(write_if_changed(path, b"changes", entry)[0])
+        with open(path, "rb") as output:
+            self.assertEqual(output.read(), b"changes")
+
+    def test_manifest_write(self):
+        manifest = Manifest(self.manifest)
+        self.assertTrue(manifest.write(self.path("out.rst"), b"content"))
+        self.assertFalse(manifest.write(self.path("out.rst"), b"content"))
+        manifest.save()
+        self.assertEqual(len(Manifest(self.manifest)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import io
+import unittest
+
+from rstcloth import RstCloth
+from rstcloth.cache import FormatCache
+
+
+class TestFormatCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = FormatCache(maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        self.assertEqual(cache.get("a"), "1")
+        cache.put("c", "3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "3")
+        self.assertEqual(cache.info(), (2, 1, 2, 2))
+
+    def test_clear(self):
+        cache = FormatCache()
+        cache.put("a", "1")
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 1024, 0))
+
+
+class TestCachedRstCloth(unittest.TestCase):
+    def build(self, r):
+        for _ in range(3):
+            r.note(content=["the " * 20, "second"], fields=[("class", "wide")], indent=3)
+            r.field("fname", "the " * 30)
+            r.directive("test", arg="what " * 20)
+            r.content("the " * 30)
+            r.author(value="me")
+
+    def test_output_unchanged(self):
+        expected = RstCloth(stream=io.StringIO())
+        self.build(expected)
+        r = RstCloth(stream=io.StringIO(), cache_size=16)
+        self.build(r)
+        self.assertEqual(r.data, expected.data)
+
+    def test_hits(self):
+        r = RstCloth(stream=io.StringIO(), cache_size=64)
+        r.note(content="the " * 20)
+        misses = r.cache.misses
+        r.note(content="the " * 20)
+        r.note(content="the " * 20)
+        self.assertEqual(r.cache.misses, misses)
+        self.assertEqual(r.cache.hits, 2)
+
+    def test_unhashable_arguments(self):
+        r = RstCloth(stream=io.StringIO(), cache_size=16)
+        r.directive("test", fields=[["a", "b"]])
+        r.directive("test", fields=[["a", "b"]])
+        self.assertEqual(r.data, ".. test::\n" "   :a: b\n" ".. test::\n" "   :a: b\n")
+
+    def test_disabled(self):
+        self.assertIsNone(RstCloth(stream=io.StringIO()).cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
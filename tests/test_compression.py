@@ -0,0 +1,99 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import unittest
+
+from rstcloth import RstCloth
+from rstcloth.compression import CompressedWriter, compression_for
+
+
+OPENERS = {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def build(r):
+    r.title("Example")
+    for index in range(100):
+        r.h2("Section {0} é".format(index))
+        r.content("the " * 30)
+        r.codeblock("a = 1\r\nb = 2", language="python")
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        expected = RstCloth(stream=io.StringIO())
+        build(expected)
+        self.expected = expected.data
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_compression_for(self):
+        self.assertEqual(compression_for("page.rst.gz"), "gzip")
+        self.assertEqual(compression_for("page.rst.BZ2"), "bz2")
+        self.assertEqual(compression_for("page.rst.xz"), "lzma")
+        self.assertIsNone(compression_for("page.rst"))
+
+    def test_open_compressed(self):
+        for suffix, opener in OPENERS.items():
+            with self.subTest(suffix=suffix):
+                path = self.path("page.rst." + suffix)
+                with RstCloth.open(path, level=1, chunk_size=100) as r:
+                    build(r)
+                self.assertTrue(r._stream.closed)
+                with opener(path, "rt", encoding="utf-8", newline="") as f:
+                    self.assertEqual(f.read(), self.expected)
+
+    def test_open_uncompressed(self):
+        path = self.path("page.rst")
+        with RstCloth.open(path) as r:
+            build(r)
+            self.assertEqual(r.data, self.expected)
+        with open(path, encoding="utf-8", newline="") as f:
+            self.assertEqual(f.read(), self.expected)
+
+    def test_data(self):
+        for suffix, opener in OPENERS.items():
+            with self.subTest(suffix=suffix):
+                path = self.path("page.rst." + suffix)
+                r = RstCloth.open(path, chunk_size=100)
+                r.h1("first")
+                mark = r.mark()
+                self.assertEqual(r.data, "first\n=====\n")
+                build(r)
+                self.assertEqual(r.data_since(mark), self.expected)
+                self.assertEqual(r.data, "first\n=====\n" + self.expected)
+                r.close()
+                self.assertEqual(r.data_since(mark), self.expected)
+                with opener(path, "rt", encoding="utf-8", newline="") as f:
+                    self.assertEqual(f.read(), "first\n=====\n" + self.expected)
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            CompressedWriter(self.path("page.rst"))
+        with self.assertRaises(ValueError):
+            CompressedWriter(self.path("page.rst"), compression="zip")
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_invalid_level(self):
+        for suffix in OPENERS:
+            with self.subTest(suffix=suffix):
+                with self.assertRaises((ValueError, lzma.LZMAError)):
+                    CompressedWriter(self.path("page.rst." + suffix), level=99)
+                self.assertEqual(os.listdir(self.directory), [])
+
+    def test_closed(self):
+        with CompressedWriter(self.path("page.rst.gz")) as stream:
+            stream.write("text")
+        with self.assertRaises(ValueError):
+            stream.write("more")
+        self.assertEqual(stream.getvalue(), "text")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import io
+import pickle
+import unittest
+
+from rstcloth import RstCloth, RstDocument
+
+
+class TestRstDocument(unittest.TestCase):
+    def build(self, r):
+        r.title("Example")
+        r.newline()
+        r.content("the " * 30)
+        r.note(content="the " * 20)
+        r.li(["foo", "bar"], indent=3)
+        r.table(["span", "ham"], [[1, 2]])
+        r.content(r.bold("done"))
+
+    def test_render_matches_rstcloth(self):
+        expected = RstCloth(stream=io.StringIO())
+        self.build(expected)
+        doc = RstDocument()
+        self.build(doc)
+        self.assertEqual(doc.render(), expected.data)
+
+    def test_render_at_other_line_width(self):
+        expected = RstCloth(stream=io.StringIO(), line_width=40)
+        self.build(expected)
+        doc = RstDocument()
+        self.build(doc)
+        self.assertEqual(doc.render(line_width=40), expected.data)
+        self.assertEqual(doc.render(line_width=40), expected.data)
+
+    def test_nodes_are_deferred(self):
+        doc = RstDocument()
+        doc.h1("first")
+        doc.h2("second")
+        self.assertEqual(len(doc), 2)
+        doc.nodes.reverse()
+        self.assertEqual(doc.render(), "second\n------\nfirst\n=====\n")
+
+    def test_write_to(self):
+        stream = io.StringIO()
+        doc = RstDocument()
+        doc.li("foo")
+        doc.write_to(stream)
+        self.assertEqual(stream.getvalue(), "- foo\n")
+
+    def test_inline_helpers(self):
+        self.assertEqual(RstDocument().pre("text"), "``text``")
+
+    def test_not_elements(self):
+        doc = RstDocument()
+        for name in ("data", "fill", "_add", "missing"):
+            with self.subTest(name=name):
+                with self.assertRaises(AttributeError):
+                    getattr(doc, name)
+
+    def test_pickle(self):
+        doc = RstDocument()
+        doc.h1("test")
+        self.assertEqual(pickle.loads(pickle.dumps(doc)).render(), "test\n====\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import os
+import stat
+import tempfile
+import unittest
+
+from rstcloth import RstCloth
+from rstcloth.fragments import FragmentStore
+
+
+def render_section(doc, store, title, rows):
+    with doc.fragment(store, "section", [title, rows]) as cached:
+        if not cached:
+            doc.h2(title)
+            doc.content("the " * 30)
+            doc.table(["name", "value"], rows)
+        return cached
+
+
+class TestFragments(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.store = FragmentStore(self.directory)
+        self.rows = [["a", "1"], ["b", "2"]]
+
+    def render(self, title="Section", **kwargs):
+        r = RstCloth(stream=io.StringIO(), **kwargs)
+        r.h1("Page")
+        cached = render_section(r, self.store, title, self.rows)
+        r.content("after")
+        r.flush()
+        return r.data, cached
+
+    def test_hit_writes_cached_fragment(self):
+        first, cached = self.render()
+        self.assertFalse(cached)
+        second, cached = self.render()
+        self.assertTrue(cached)
+        self.assertEqual(first, second)
+        self.assertEqual(self.store.hits, 1)
+        self.assertEqual(self.store.misses, 1)
+        self.assertEqual(self.store.hit_ratio, 0.5)
+
+    def test_uncached_output_unchanged(self):
+        r = RstCloth(stream=io.StringIO())
+        r.h1("Page")
+        r.h2("Section")
+        r.content("the " * 30)
+        r.table(["name", "value"], self.rows)
+        r.content("after")
+        self.assertEqual(self.render()[0], r.data)
+
+    def test_buffered(self):
+        expected = self.render()[0]
+        self.assertEqual(self.render(buffer_size=16)[0], expected)
+        self.assertEqual(self.render(buffer_size=4096)[0], expected)
+
+    def test_key_includes_inputs_and_line_width(self):
+        self.render()
+        self.assertFalse(self.render(title="Other")[1])
+        self.assertFalse(self.render(line_width=40)[1])
+        self.rows = [["a", "1"]]
+        self.assertFalse(self.render()[1])
+        self.assertEqual(self.store.hits, 0)
+
+    def test_key_includes_block_indent(self):
+        r = RstCloth(stream=io.StringIO())
+        with r.block(3):
+            self.assertFalse(render_section(r, self.store, "Section", self.rows))
+        self.assertFalse(self.render()[1])
+        r = RstCloth(stream=io.StringIO())
+        with r.block(3):
+            self.assertTrue(render_section(r, self.store, "Section", self.rows))
+        self.assertTrue(r.data.startswith("   Section\n   -------\n"))
+
+    def test_persisted(self):
+        expected = self.render()[0]
+        self.store = FragmentStore(self.directory)
+        self.assertEqual(self.render(), (expected, True))
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_fragment_mode(self):
+        umask = os.umask(0o022)
+        try:
+            self.store.put("key", "text")
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.directory, "key.rst")).st_mode), 0o644)
+
+    def test_exception_not_cached(self):
+        r = RstCloth(stream=io.StringIO())
+        with self.assertRaises(RuntimeError):
+            with r.fragment(self.store, "broken") as cached:
+                self.assertFalse(cached)
+                r.content("partial")
+                raise RuntimeError()
+        r.content("after")
+        self.assertEqual(r.data, "after\n")
+        self.assertEqual(len(self.store), 0)
+
+    def test_eviction(self):
+        store = FragmentStore(self.directory, max_size=100)
+        for index in range(5):
+            key = store.key("fragment", index, 72)
+            store.put(key, "x" * 30)
+            os.utime(store._path(key), ns=(index * 10**9, index * 10**9))
+        self.assertEqual(len(store), 3)
+        self.assertLessEqual(store.info().currsize, 100)
+        self.assertIsNone(store.get(store.key("fragment", 0, 72)))
+        self.assertEqual(store.get(store.key("fragment", 4, 72)), "x" * 30)
+
+    def test_clear(self):
+        self.render()
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.info(), (0, 0, 64 * 1024 * 1024, 0))
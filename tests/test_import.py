@@ -0,0 +1,56 @@
+import subprocess
+import sys
+import unittest
+
+
+# Budget for importing RstCloth and RstDocument, in microseconds, as reported
+# by python -X importtime. It is generous, so that slow CI machines without
+# cached bytecode stay under it; test_optional_modules_not_imported is the
+# precise check that table backends and other optional modules stay lazy.
+IMPORT_BUDGET = 150000
+
+
+def import_times(statement):
+    """Runs statement in a fresh interpreter and returns the cumulative import time of each top level import."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented below the import which caused them.
+        times.append((name[1:], int(cumulative)))
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    statement = "from rstcloth import RstCloth, RstDocument"
+
+    def test_budget(self):
+        times = import_times(self.statement)
+        names = [name for name, _ in times]
+        start = names.index("rstcloth")
+        total = sum(cumulative for name, cumulative in times[start:] if not name.startswith(" "))
+        self.assertLess(total, IMPORT_BUDGET)
+
+    def test_optional_modules_not_imported(self):
+        names = {name.strip() for name, _ in import_times(self.statement)}
+        self.assertIn("rstcloth.rstcloth", names)
+        for module in ("tabulate", "tempfile", "json", "mmap", "concurrent.futures", "rstcloth.include"):
+            with self.subTest(module=module):
+                self.assertNotIn(module, names)
+
+    def test_package_imported_lazily(self):
+        names = {name.strip() for name, _ in import_times("import rstcloth.wrapping")}
+        self.assertIn("rstcloth.wrapping", names)
+        self.assertNotIn("rstcloth.rstcloth", names)
+
+    def test_lazy_attributes(self):
+        import rstcloth
+
+        self.assertIs(rstcloth.RstCloth, rstcloth.rstcloth.RstCloth)
+        self.assertIn("RstDocument", dir(rstcloth))
+        with self.assertRaises(AttributeError):
+            rstcloth.missing
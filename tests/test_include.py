@@ -0,0 +1,74 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from rstcloth import RstCloth
+from rstcloth.include import LineIndex, line_index, read_lines
+
+
+class TestLineIndex(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = pathlib.Path(directory.name) / "source.py"
+
+    def write(self, text):
+        self.path.write_bytes(text.encode("utf-8"))
+
+    def test_offsets(self):
+        for text in ["", "a", "a\n", "a\nbc\n\nd", "\n\n", "é\r\nb\n"]:
+            with self.subTest(text=text):
+                self.write(text)
+                index = LineIndex(self.path)
+                lines = text.encode("utf-8").split(b"\n")
+                if lines[-1] == b"":
+                    lines.pop()
+                self.assertEqual(len(index), len(lines))
+                for number in range(1, len(lines) + 1):
+                    first, last = index.span(number, number)
+                    self.assertEqual(text.encode("utf-8")[first:last].rstrip(b"\n"), lines[number - 1])
+
+    def test_scanned_in_blocks(self):
+        text = "".join("line {0}\n".format(number) for number in range(100))
+        self.write(text)
+        with mock.patch("rstcloth.include._SCAN_SIZE", 7):
+            index = LineIndex(self.path)
+        self.assertEqual(list(index.offsets), list(LineIndex(self.path).offsets))
+        self.assertEqual(len(index), 100)
+
+    def test_span(self):
+        self.write("a\nb\nc\n")
+        index = LineIndex(self.path)
+        self.assertEqual(index.span(), (0, 6))
+        self.assertEqual(index.span(2), (2, 6))
+        self.assertEqual(index.span(2, 2), (2, 4))
+        self.assertEqual(index.span(2, 10), (2, 6))
+        self.assertEqual(index.span(3, 2), (0, 0))
+        with self.assertRaises(ValueError):
+            index.span(0)
+
+    def test_cached_until_modified(self):
+        self.write("a\nb\n")
+        index = line_index(self.path)
+        self.assertIs(line_index(self.path), index)
+        self.write("a\nb\nc\n")
+        os.utime(self.path, ns=(index.mtime_ns + 10**9, index.mtime_ns + 10**9))
+        self.assertIsNot(line_index(self.path), index)
+        self.assertEqual(len(line_index(self.path)), 3)
+
+    def test_read_lines(self):
+        self.write("".join("line {0}\n".format(number) for number in range(1, 11)))
+        self.assertEqual(read_lines(self.path, 3, 4), "line 3\nline 4\n")
+        self.assertEqual(read_lines(self.path, 10), "line 10\n")
+        self.assertEqual(read_lines(self.path, 11), "")
+
+    def test_literal_include(self):
+        source = "".join("    value_{0} = {0}\n".format(number) for number in range(1, 101))
+        self.write(source)
+        expected = RstCloth(stream=None)
+        expected.codeblock("\n".join(source.splitlines()[11:20]), indent=2, language="python")
+        r = RstCloth(stream=None)
+        r.literal_include(self.path, start=12, end=20, indent=2, language="python")
+        self.assertEqual(r.data, expected.data)
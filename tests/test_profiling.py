@@ -0,0 +1,127 @@
+import io
+import json
+import os
+import pstats
+import tempfile
+import unittest
+from unittest import mock
+
+from rstcloth import CompactRstCloth, RstCloth
+from rstcloth.profiling import ElementStats, instrument, uninstrument
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.r = RstCloth(stream=None)
+        self.profile = instrument(self.r)
+
+    def test_output_unchanged(self):
+        plain = RstCloth(stream=None)
+        for r in (self.r, plain):
+            r.h1("test")
+            r.content("this is sparta " * 10)
+            r.note(content="x y z")
+            r.table(["a"], [["b"]])
+        self.assertEqual(self.r.data, plain.data)
+
+    def test_counts(self):
+        self.r.li("foo")
+        self.r.li("bar")
+        self.r.content("this is sparta " * 10)
+        self.assertEqual(self.profile["li"].calls, 2)
+        self.assertEqual(self.profile["li"].bytes, len("- foo\n- bar\n"))
+        self.assertEqual(self.profile["content"].calls, 1)
+        self.assertEqual(self.profile["content"].fills, 1)
+        self.assertGreater(self.profile["content"].seconds, 0)
+        self.assertEqual(sum(stats.bytes for stats in self.profile.elements.values()), len(self.r.data))
+
+    def test_nested_calls_accounted_to_outermost(self):
+        self.r.h1("test")
+        self.r.warning(content="careful")
+        self.assertIn("h1", self.profile)
+        self.assertIn("warning", self.profile)
+        self.assertNotIn("heading", self.profile)
+        self.assertNotIn("directive", self.profile)
+
+    def test_bytes_streamed(self):
+        for buffer_size in (None, 8):
+            with self.subTest(buffer_size=buffer_size):
+                r = RstCloth(stream=None, buffer_size=buffer_size)
+                profile = instrument(r)
+                with mock.patch("rstcloth.rstcloth.INDENT_CHUNK_SIZE", 8):
+                    r.codeblock("x = 1\n" * 10)
+                r.codeblock(iter(["a", "b"]))
+                r.content("hello")
+                self.assertEqual(sum(stats.bytes for stats in profile.elements.values()), len(r.data))
+
+    def test_bytes_in_block(self):
+        for buffer_size in (None, 8):
+            with self.subTest(buffer_size=buffer_size):
+                r = RstCloth(stream=None, buffer_size=buffer_size)
+                profile = instrument(r)
+                with r.block(3):
+                    r.content("this is sparta " * 10)
+                    r.li(["foo", "", "bar"])
+                    with r.block(2):
+                        r.codeblock(iter(["a", "", "b"]))
+                        r.codeblock(iter(["x = 1\n", "", "\ny", " = 2\n\n"]))
+                    r.note(content="x y z")
+                self.assertEqual(sum(stats.bytes for stats in profile.elements.values()), len(r.data))
+
+    def test_bytes_encoded(self):
+        self.r.content("café")
+        self.assertEqual(self.profile["content"].bytes, len("café\n".encode("utf-8")))
+
+    def test_table_list_fills(self):
+        self.r.table_list(["a", "b"], [["1", "2"], ["3", "4"]])
+        # One fill for the header-rows field and one per cell.
+        self.assertEqual(self.profile["table_list"].fills, 7)
+
+    def test_direct_fill(self):
+        self.r.fill("this is sparta")
+        self.assertEqual(self.profile["fill"].calls, 1)
+        self.assertEqual(self.profile["fill"].fills, 1)
+
+    def test_inline_markup_not_instrumented(self):
+        self.assertEqual(self.r.bold("x"), "**x**")
+        self.assertNotIn("bold", self.profile)
+
+    def test_dump_json(self):
+        self.r.li("foo")
+        stream = io.StringIO()
+        self.profile.dump_json(stream)
+        counters = json.loads(stream.getvalue())
+        self.assertEqual(counters["li"]["calls"], 1)
+        self.assertEqual(counters["li"]["bytes"], 6)
+
+    def test_pstats(self):
+        self.r.li("foo")
+        self.r.li("bar")
+        stats = pstats.Stats(self.profile, stream=io.StringIO())
+        self.assertEqual(stats.total_calls, 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rstcloth.prof")
+            self.profile.dump_stats(path)
+            stats = pstats.Stats(path, stream=io.StringIO())
+        self.assertEqual(stats.stats[("rstcloth", 0, "li")][:2], (2, 2))
+
+    def test_instrument_twice(self):
+        self.assertIs(instrument(self.r), self.profile)
+
+    def test_uninstrument(self):
+        self.assertIs(uninstrument(self.r), self.profile)
+        self.assertIs(type(self.r), RstCloth)
+        self.r.li("foo")
+        self.assertEqual(self.profile.elements, {})
+        self.assertIsNone(uninstrument(self.r))
+
+    def test_compact(self):
+        r = CompactRstCloth(stream=None)
+        profile = instrument(r)
+        r.li("foo")
+        self.assertEqual(profile["li"].bytes, len(r.data))
+        uninstrument(r)
+        self.assertIs(type(r), CompactRstCloth)
+
+    def test_element_stats(self):
+        self.assertEqual(ElementStats(calls=1).as_dict(), {"calls": 1, "seconds": 0.0, "bytes": 0, "fills": 0})
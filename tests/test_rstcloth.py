@@ -1,8 +1,13 @@
 import io
+import pathlib
+import tempfile
 import unittest
+import weakref
+from unittest import mock
 import pytest
 
-from rstcloth import RstCloth
+from rstcloth import CompactRstCloth, Field, RstCloth
+from rstcloth.rstcloth import _indent, _iter_indent, _iter_indent_text
 
 
 class TestRstCloth(unittest.TestCase):
@@ -497,6 +502,305 @@ class TestRstCloth(unittest.TestCase):
         self.assertEqual(self.r.data, expected)
 
 
+class TestBufferedRstCloth(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.r = RstCloth(stream=self.stream, buffer_size=64)
+
+    def test_buffered_until_flush(self):
+        self.r.content("this is sparta")
+        self.assertEqual(self.stream.getvalue(), "")
+        self.r.flush()
+        self.assertEqual(self.stream.getvalue(), "this is sparta\n")
+
+    def test_buffered_flushes_at_threshold(self):
+        self.r.content("the " * 10)
+        self.assertEqual(self.stream.getvalue(), "")
+        self.r.content("the " * 10)
+        self.assertEqual(self.stream.getvalue(), "the" + " the" * 9 + "\n" + "the" + " the" * 9 + "\n")
+
+    def test_buffered_data(self):
+        self.r.h1("test")
+        self.assertEqual(self.r.data, "test\n" "====\n")
+
+    def test_buffered_context_manager(self):
+        with self.r as r:
+            r.li("foo")
+            self.assertEqual(self.stream.getvalue(), "")
+        self.assertEqual(self.stream.getvalue(), "- foo\n")
+
+    def test_close(self):
+        self.r.li("foo")
+        self.r.close()
+        self.assertTrue(self.stream.closed)
+
+
+class TestRstClothData(unittest.TestCase):
+    def test_owned_buffer(self):
+        r = RstCloth(stream=None)
+        r.h1("test")
+        r.content("this is sparta")
+        self.assertEqual(r.data, "test\n====\nthis is sparta\n")
+
+    def test_data_since(self):
+        for stream in (None, io.StringIO()):
+            r = RstCloth(stream=stream, buffer_size=8)
+            r.h1("test")
+            mark = r.mark()
+            r.li("foo")
+            r.li("bar")
+            self.assertEqual(r.data_since(mark), "- foo\n- bar\n")
+            self.assertEqual(r.data_since(r.mark()), "")
+
+    def test_data_restores_position(self):
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        r = RstCloth(stream=stream)
+        r.li("foo")
+        self.assertEqual(r.data, "- foo\n")
+        r.li("bar")
+        self.assertEqual(r.data, "- foo\n- bar\n")
+
+    def test_getbuffer(self):
+        for stream in (None, io.StringIO()):
+            r = RstCloth(stream=stream)
+            r.content("café")
+            self.assertEqual(r.getbuffer().tobytes(), "café\n".encode("utf-8"))
+
+
+class TestBatchElements(unittest.TestCase):
+    items = ["foo", "a " * 60, ["bar", "baz"], "x\ty"]
+
+    def render(self, build, **kwargs):
+        r = RstCloth(stream=None, **kwargs)
+        build(r)
+        return r.data
+
+    def assertSameOutput(self, batch, single):
+        for kwargs in ({}, {"cache_size": 16}, {"buffer_size": 32}):
+            self.assertEqual(self.render(batch, **kwargs), self.render(single, **kwargs))
+
+    def test_li_many(self):
+        for indent in (0, 3):
+            self.assertSameOutput(
+                lambda r: r.li_many(iter(self.items), bullet="*", indent=indent),
+                lambda r: [r.li(item, bullet="*", indent=indent) for item in self.items],
+            )
+
+    def test_content_many(self):
+        for indent in (0, 3):
+            self.assertSameOutput(
+                lambda r: r.content_many(self.items, indent=indent),
+                lambda r: [r.content(item, indent=indent) for item in self.items],
+            )
+
+    def test_field_many(self):
+        fields = [("Author", "me"), ("Abstract", "word " * 40), ("x" * 70, "long value")]
+        self.assertSameOutput(
+            lambda r: r.field_many(fields, indent=2),
+            lambda r: [r.field(name, value, indent=2) for name, value in fields],
+        )
+
+    def test_definitions(self):
+        items = [("term", "a definition"), ("other", "word " * 40)]
+        for bold in (False, True):
+            self.assertSameOutput(
+                lambda r: r.definitions(items, indent=2, bold=bold),
+                lambda r: [r.definition(name, text, indent=2, bold=bold) for name, text in items],
+            )
+
+    def test_single_write(self):
+        stream = mock.Mock()
+        RstCloth(stream=stream).li_many(["foo", "bar"])
+        stream.write.assert_called_once_with("- foo\n- bar\n")
+
+    def test_empty(self):
+        stream = io.StringIO()
+        r = RstCloth(stream=stream)
+        r.li_many([])
+        r.content_many([])
+        r.field_many([])
+        r.definitions([])
+        self.assertEqual(stream.getvalue(), "")
+
+
+class TestIndent(unittest.TestCase):
+    def splitlines_indent(self, content, indent):
+        if indent == 0:
+            return content
+        if isinstance(content, str):
+            content = content.splitlines()
+        return "\n".join([" " * indent + line if line else line for line in content])
+
+    def test_indent(self):
+        for content in ["", "a", "a\n", "\na\n\n", "a\n\n\nb", "a\r\nb\x0cc", "\n", ["a", "", "b"]]:
+            for indent in (0, 3):
+                with self.subTest(content=content, indent=indent):
+                    self.assertEqual(_indent(content, indent), self.splitlines_indent(content, indent))
+
+    def test_iter_indent(self):
+        for content in ["", "a\nb\n\nc\n", "a\n\n\nb\n\n", "a\rb\r\n\nc", ["a", "", "b", "c"]]:
+            for chunk_size in (1, 2, 100):
+                with self.subTest(content=content, chunk_size=chunk_size):
+                    chunks = list(_iter_indent(content, 3, chunk_size))
+                    self.assertEqual("".join(chunks), self.splitlines_indent(content, 3))
+
+    def test_large_codeblock(self):
+        content = "def f():\n\n    return 1\n" * 10
+        expected = io.StringIO()
+        RstCloth(stream=expected).codeblock(content, indent=2, language="python")
+        for buffer_size in (None, 16):
+            stream = io.StringIO()
+            with mock.patch("rstcloth.rstcloth.INDENT_CHUNK_SIZE", 16):
+                with RstCloth(stream=stream, buffer_size=buffer_size) as r:
+                    r.codeblock(content, indent=2, language="python")
+            self.assertEqual(stream.getvalue(), expected.getvalue())
+
+
+class TestStreamedContent(unittest.TestCase):
+    text = "first line of the log\n\nsecond " + "word " * 30 + "\r\nthird\n"
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = pathlib.Path(directory.name) / "build.log"
+        self.path.write_bytes(self.text.encode("utf-8"))
+
+    def render(self, content, **kwargs):
+        r = RstCloth(stream=None, **kwargs)
+        r.codeblock(content, indent=2, language="text")
+        return r.data
+
+    def render_directive(self, content, **kwargs):
+        r = RstCloth(stream=None, **kwargs)
+        r.note(content=content, fields=[("class", "log")], indent=2)
+        return r.data
+
+    def test_codeblock_sources(self):
+        expected = self.render(self.text)
+        for kwargs in ({}, {"buffer_size": 16}):
+            self.assertEqual(self.render(self.path, **kwargs), expected)
+            self.assertEqual(self.render(io.StringIO(self.text), **kwargs), expected)
+            self.assertEqual(self.render(iter(self.text.splitlines()), **kwargs), expected)
+
+    def test_codeblock_read_in_chunks(self):
+        expected = self.render(self.text)
+        with mock.patch("rstcloth.rstcloth.INDENT_CHUNK_SIZE", 4):
+            self.assertEqual(self.render(self.path), expected)
+            self.assertEqual(self.render(io.StringIO(self.text)), expected)
+
+    def test_directive_sources(self):
+        expected = self.render_directive(self.text.splitlines())
+        for kwargs in ({}, {"buffer_size": 16}, {"cache_size": 8}):
+            self.assertEqual(self.render_directive(self.path, **kwargs), expected)
+            self.assertEqual(self.render_directive(io.StringIO(self.text), **kwargs), expected)
+            self.assertEqual(self.render_directive(iter(self.text.splitlines()), **kwargs), expected)
+
+    def test_directive_empty_iterator(self):
+        self.assertEqual(self.render_directive(iter([])), self.render_directive([]))
+
+    def test_iter_indent_text(self):
+        for text in ["", "a", "a\n", "\n\n", "a\r\nb\r", "a\x0c\nb\n\n", "a\n\x85b"]:
+            for size in (1, 2, 3):
+                with self.subTest(text=text, size=size):
+                    bounds = zip(range(0, len(text), size), range(size, len(text) + size, size))
+                    chunks = [text[start:end] for start, end in bounds]
+                    self.assertEqual("".join(_iter_indent_text(chunks, 3)), _indent(text, 3))
+
+
+class TestCompactRstCloth(unittest.TestCase):
+    def test_no_instance_dict(self):
+        r = CompactRstCloth(stream=io.StringIO())
+        self.assertFalse(hasattr(r, "__dict__"))
+        with self.assertRaises(AttributeError):
+            r.anything = 1
+
+    def test_rstcloth_keeps_dict(self):
+        r = RstCloth(stream=None)
+        r.anything = 1
+        self.assertEqual(r.anything, 1)
+        with mock.patch.object(r, "_add") as add:
+            r.content("text")
+        add.assert_called()
+        self.assertEqual(r.data, "")
+
+    def test_same_output(self):
+        expected = RstCloth(stream=None, buffer_size=16)
+        r = CompactRstCloth(stream=None, buffer_size=16)
+        for cloth in (expected, r):
+            cloth.h1("Title")
+            with cloth.block(2):
+                cloth.content("the quick brown fox " * 10)
+                cloth.codeblock(iter(["a", "", "b"]))
+            cloth.table(["a", "b"], [[1, 2]])
+        self.assertEqual(r.data, expected.data)
+
+    def test_weak_reference(self):
+        for cls in (RstCloth, CompactRstCloth):
+            r = cls(stream=io.StringIO())
+            self.assertIs(weakref.ref(r)(), r)
+
+    def test_subclass_keeps_dict(self):
+        class Subclass(CompactRstCloth):
+            pass
+
+        r = Subclass(stream=io.StringIO())
+        r.anything = 1
+        self.assertEqual(r.anything, 1)
+
+    def test_directive_fields(self):
+        expected = RstCloth(stream=None)
+        expected.directive("image", "picture.png", fields=[("alt", "a picture"), ("width", "100")])
+        r = RstCloth(stream=None)
+        r.directive("image", "picture.png", fields=[Field("alt", "a picture"), Field(name="width", value="100")])
+        self.assertEqual(r.data, expected.data)
+
+
+class TestBlock(unittest.TestCase):
+    text = "the quick brown fox jumps over the lazy dog " * 5
+
+    def build(self, r, indent):
+        r.content(self.text, indent=indent)
+        r.li(self.text, indent=indent)
+        r.field("Name", self.text, indent=indent)
+        r.directive("note", arg=self.text, fields=[("class", "tip")], content=[self.text, "two"], indent=indent)
+        r.codeblock(io.StringIO("a\n\nb\r\nc\n" * 100), indent=indent)
+        r.codeblock(iter(["x", "", "y"]), indent=indent, language="python")
+        r.directive("note", content=iter(["p", "q"]), indent=indent)
+        r.h2("Heading", indent=indent)
+        r.table(["a", "b"], [[1, 2]], indent=indent)
+        r.table_list(["a", "b"], [["x", self.text]], indent=indent)
+        r.newline(3)
+
+    def test_block_matches_indent(self):
+        for buffer_size in (None, 64):
+            with self.subTest(buffer_size=buffer_size):
+                expected = RstCloth(stream=io.StringIO(), line_width=60, buffer_size=buffer_size)
+                self.build(expected, 5)
+                r = RstCloth(stream=io.StringIO(), line_width=60, buffer_size=buffer_size)
+                with r.block(2):
+                    with r.block():
+                        self.build(r, 0)
+                self.assertEqual(r.data, expected.data)
+
+    def test_block_restores_indent(self):
+        r = RstCloth(stream=io.StringIO())
+        with self.assertRaises(ValueError):
+            with r.block(4):
+                r.content("indented")
+                raise ValueError()
+        r.content("not indented")
+        self.assertEqual(r.data, "    indented\nnot indented\n")
+
+    def test_directive_block(self):
+        expected = RstCloth(stream=io.StringIO())
+        expected.note(arg="Title", content=[self.text, "two"], indent=2)
+        r = RstCloth(stream=io.StringIO())
+        with r.directive_block("note", "Title", indent=2):
+            r.content(self.text)
+            r.content("two")
+        self.assertEqual(r.data, expected.data)
+
+
 class TestTable(unittest.TestCase):
     """Testing operation of the Rst generator"""
 
@@ -566,6 +870,44 @@ class TestTable(unittest.TestCase):
         given = r.data
         self.assertEqual(expected, given)
 
+    def test_spooled_table(self):
+        header = ["span", "ham"]
+        data = [[1, "multi\nline"], [None, "eggs"], ["bacon", 4]]
+        expected = RstCloth(stream=io.StringIO())
+        expected.table(header, data, indent=3)
+        r = RstCloth(stream=io.StringIO())
+        r.spooled_table(header, iter(data), indent=3)
+        self.assertEqual(r.data, expected.data)
+
+    def test_spooled_table_on_disk(self):
+        data = [[str(i), "spam " * 10] for i in range(100)]
+        expected = RstCloth(stream=io.StringIO())
+        expected.table(["span", "ham"], data)
+        r = RstCloth(stream=io.StringIO())
+        with mock.patch("rstcloth.tables.SPOOL_SIZE", 128):
+            r.spooled_table(["span", "ham"], (row for row in data))
+        self.assertEqual(r.data, expected.data)
+
+    def test_spooled_table_empty(self):
+        r = RstCloth(stream=io.StringIO())
+        r.spooled_table([], [])
+        self.assertEqual(r.data, "\n\n\n")
+
+    def test_spooled_table_no_rows(self):
+        for method in ("table", "simple_table"):
+            with self.subTest(method=method):
+                expected = RstCloth(stream=io.StringIO())
+                getattr(expected, method)(["span", "ham"], None)
+                r = RstCloth(stream=io.StringIO())
+                getattr(r, "spooled_" + method)(["span", "ham"], None)
+                self.assertEqual(r.data, expected.data)
+
+    def test_spooled_table_ragged(self):
+        r = RstCloth(stream=io.StringIO())
+        with self.assertRaises(ValueError):
+            r.spooled_table(["span", "ham"], [[1]])
+        self.assertEqual(r.data, "")
+
     def test_table_list(self):
         r = RstCloth(stream=io.StringIO())
         headers = ["span", "ham"]
@@ -649,6 +991,38 @@ class TestTable(unittest.TestCase):
         r.table_list(headers, data, width="80%")
         self.assertEqual(r.data, expected)
 
+    def test_table_list_generator(self):
+        r = RstCloth(stream=io.StringIO())
+        expected = ".. list-table::\n" "\n" "   * - 1\n" "     - 2\n" "   * - 3\n" "     - 4\n" "\n"
+
+        r.table_list([], ([str(i), str(i + 1)] for i in (1, 3)))
+        self.assertEqual(r.data, expected)
+
+    def test_table_list_matches_li(self):
+        headers = ["span", ["ham", "eggs"]]
+        data = [["spam " * 30, ""], [["spam"] * 20, "ham"]]
+        expected = RstCloth(stream=io.StringIO())
+        expected.directive("list-table", fields=[("header-rows", "1")], indent=3)
+        expected.newline()
+        for row in [headers] + data:
+            expected.li(row[0], bullet="* -", indent=6)
+            for cell in row[1:]:
+                expected.li(cell, bullet="  -", indent=6)
+        expected.newline()
+
+        r = RstCloth(stream=io.StringIO())
+        r.table_list(headers, data, indent=3)
+        self.assertEqual(r.data, expected.data)
+
+    def test_table_list_uses_fill(self):
+        class Upper(RstCloth):
+            def fill(self, text, initial_indent=0, subsequent_indent=0):
+                return super().fill(text.upper(), initial_indent, subsequent_indent)
+
+        r = Upper(stream=io.StringIO())
+        r.table_list(["span", "ham"], [["eggs", "spam"]])
+        self.assertIn("* - SPAN\n     - HAM\n   * - EGGS\n     - SPAM\n", r.data)
+
 
 class SimpleTestTable(unittest.TestCase):
     """Testing operation of the Rst generator for simple tables"""
@@ -697,6 +1071,15 @@ class SimpleTestTable(unittest.TestCase):
         given = r.data
         self.assertEqual(expected, given)
 
+    def test_spooled_simple_table(self):
+        header = ["span", "ham"]
+        data = [[1, 2], ["", 4], [None, None]]
+        expected = RstCloth(stream=io.StringIO())
+        expected.simple_table(header, data, indent=3)
+        r = RstCloth(stream=io.StringIO())
+        r.spooled_simple_table(header, iter(data), indent=3)
+        self.assertEqual(r.data, expected.data)
+
 
 @pytest.mark.parametrize(
     "header,data,expected",
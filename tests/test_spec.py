@@ -0,0 +1,87 @@
+import io
+import json
+import pathlib
+import tempfile
+import unittest
+import yaml
+
+from rstcloth import RstCloth
+from rstcloth.spec import SpecError, iter_spec, render_spec
+
+
+SPEC = """
+- title: Example
+- newline:
+- content: &text The text of the example.
+- note: *text
+- li: [foo, bar]
+- table:
+    header: [span, ham]
+    data: [[1, 2]]
+- author: Someone
+"""
+
+
+class TestSpec(unittest.TestCase):
+    def build(self, r):
+        r.title("Example")
+        r.newline()
+        r.content("The text of the example.")
+        r.note(arg="The text of the example.")
+        r.li(["foo", "bar"])
+        r.table(header=["span", "ham"], data=[[1, 2]])
+        r.author(value="Someone")
+
+    def render(self, spec):
+        cloth = RstCloth(stream=io.StringIO())
+        render_spec(spec, cloth)
+        return cloth.data
+
+    def test_render_matches_rstcloth(self):
+        expected = RstCloth(stream=io.StringIO())
+        self.build(expected)
+        self.assertEqual(self.render(SPEC), expected.data)
+        self.assertEqual(self.render(io.BytesIO(SPEC.encode("utf-8"))), expected.data)
+
+    def test_render_json(self):
+        spec = json.dumps(yaml.safe_load(SPEC))
+        self.assertEqual(self.render(spec), self.render(SPEC))
+
+    def test_render_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory, "spec.yaml")
+            path.write_text(SPEC)
+            self.assertEqual(self.render(path), self.render(SPEC))
+
+    def test_nodes_are_parsed_lazily(self):
+        nodes = iter_spec("- h1: first\n- h2: second\n- [not an element]\n")
+        self.assertEqual(next(nodes).name, "h1")
+        self.assertEqual(next(nodes).name, "h2")
+        with self.assertRaises(SpecError):
+            next(nodes)
+
+    def test_arguments(self):
+        nodes = list(iter_spec("- newline:\n- h1: x\n- li: y\n- codeblock: {content: z, language: py}\n"))
+        self.assertEqual([node.args for node in nodes], [(), (), ("y",), ()])
+        self.assertEqual(nodes[1].kwargs, {"text": "x"})
+        self.assertEqual(nodes[3].kwargs, {"content": "z", "language": "py"})
+
+    def test_several_documents(self):
+        self.assertEqual(self.render("- h1: first\n---\n- h2: second\n"), "first\n=====\nsecond\n------\n")
+        self.assertEqual(self.render(""), "")
+
+    def test_empty_documents(self):
+        expected = self.render("- h1: first\n")
+        for spec in ["- h1: first\n---\n", "- h1: first\n--- ~\n", "---\n---\n- h1: first\n...\n---\n...\n"]:
+            with self.subTest(spec=spec):
+                self.assertEqual(self.render(spec), expected)
+
+    def test_invalid(self):
+        for spec in ["h1: x", "--- 5", "- h1: x\n--- text", "- spam: x", "- bold: x", "- data:", "- _add: x", "- {h1: x, h2: y}", "- h1: *x"]:
+            with self.subTest(spec=spec):
+                with self.assertRaises(yaml.YAMLError if "*" in spec else SpecError):
+                    list(iter_spec(spec))
+
+
+if __name__ == "__main__":
+    unittest.main()
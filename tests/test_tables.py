@@ -0,0 +1,69 @@
+import unittest
+from tabulate import tabulate
+
+from rstcloth.rstcloth import _indent
+from rstcloth.tables import TableLayout, grid_table, simple_table
+
+
+TABLES = (
+    (["span"], None),
+    (["span", "ham"], []),
+    (["span", "ham"], [[1, 2], [3, 4]]),
+    (["span", "ham"], [[None, True], [2.5, "  padded  "]]),
+    (["span", "ham"], [["multi\nline", "x"], ["", ""], ["a\n\nb", None]]),
+    (["multi\nline header", ""], [["a", "b"]]),
+    (["0", "x\n"], [["1", "2"]]),
+    (["", "ham"], [["", "b"], [" ", "d"], [None, "f"]]),
+    ([], [["a", "b"], ["c", "d"]]),
+)
+
+
+class TestTables(unittest.TestCase):
+    def test_grid_table_matches_tabulate(self):
+        for header, data in TABLES:
+            with self.subTest(header=header, data=data):
+                expected = tabulate(tabular_data=data, headers=header, tablefmt="grid", disable_numparse=True)
+                self.assertEqual("\n".join(grid_table(header, data)), expected)
+
+    def test_simple_table_matches_tabulate(self):
+        for header, data in TABLES:
+            with self.subTest(header=header, data=data):
+                expected = tabulate(tabular_data=data, headers=header, tablefmt="rst", disable_numparse=True)
+                self.assertEqual("\n".join(simple_table(header, data)), expected)
+
+    def test_indent(self):
+        self.assertEqual(
+            simple_table(["", "ham"], [[None, "x"], ["a", "b"]], indent=3),
+            ["   ====  =====", "   ..    ham", "   ====  =====", "         x", "   a     b", "   ====  ====="],
+        )
+
+    def test_indent_matches_tabulate(self):
+        for header, data in TABLES:
+            for tablefmt, table in (("grid", grid_table), ("rst", simple_table)):
+                with self.subTest(header=header, data=data, tablefmt=tablefmt):
+                    expected = tabulate(tabular_data=data, headers=header, tablefmt=tablefmt, disable_numparse=True)
+                    self.assertEqual("\n".join(table(header, data, indent=3)), _indent(expected, 3))
+
+    def test_left_to_tabulate(self):
+        unsupported = (
+            (["span"], [["tab\tseparated"]]),
+            (["span"], [["\x1b[31mred\x1b[0m"]]),
+            (["span"], [["wide 中"]]),
+            (["span"], [[b"bytes"]]),
+            (["span", "ham"], [["ragged"]]),
+            (["span"], ({"span": 1},)),
+            (["span"], iter([[1]])),
+        )
+        for header, data in unsupported:
+            with self.subTest(header=header, data=data):
+                self.assertIsNone(grid_table(header, data))
+                self.assertIsNone(simple_table(header, data))
+
+    def test_layout_rejects_ragged_rows(self):
+        layout = TableLayout(["span", "ham"])
+        with self.assertRaises(ValueError):
+            layout.add(["ragged"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import gzip
+import hashlib
+import io
+import threading
+import unittest
+
+from rstcloth import RstCloth
+from rstcloth.buffer import ChunkBuffer
+from rstcloth.tee import TeeStream
+
+
+def build(r):
+    r.title("Example")
+    for index in range(200):
+        r.h2("Section {0} é".format(index))
+        r.content("the " * 30)
+        r.li(["foo", "bar"], indent=3)
+
+
+class SlowSink(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait()
+        return super().write(text)
+
+
+class FailingSink(io.StringIO):
+    def write(self, text):
+        raise OSError("disk full")
+
+
+class TestTeeStream(unittest.TestCase):
+    def setUp(self):
+        expected = RstCloth(stream=io.StringIO())
+        build(expected)
+        self.expected = expected.data
+
+    def check(self, **kwargs):
+        text, binary, chunks = io.StringIO(), io.BytesIO(), ChunkBuffer()
+        archive = io.BytesIO()
+        compressed = gzip.GzipFile(fileobj=archive, mode="wb")
+        digest = hashlib.sha256()
+        tee = TeeStream([text, binary, chunks, compressed], hashers=[digest], **kwargs)
+        r = RstCloth(stream=tee)
+        build(r)
+        r.flush()
+        self.assertEqual(tee.tell(), len(self.expected))
+        self.assertEqual(text.getvalue(), self.expected)
+        self.assertEqual(binary.getvalue(), self.expected.encode("utf-8"))
+        self.assertEqual(chunks.getvalue(), self.expected)
+        self.assertEqual(digest.hexdigest(), hashlib.sha256(self.expected.encode("utf-8")).hexdigest())
+        r.close()
+        self.assertTrue(text.closed)
+        self.assertEqual(gzip.decompress(archive.getvalue()), self.expected.encode("utf-8"))
+
+    def test_tee(self):
+        self.check()
+
+    def test_tee_small_buffer(self):
+        self.check(buffer_size=100)
+
+    def test_tee_threaded(self):
+        self.check(threaded=True, buffer_size=100, queue_size=2)
+
+    def test_slow_sink_does_not_block_others(self):
+        slow, fast = SlowSink(), io.StringIO()
+        tee = TeeStream([slow, fast], buffer_size=1, threaded=True, queue_size=8)
+        for index in range(4):
+            tee.write("line {0}\n".format(index))
+        # The fast sink is written to while the slow sink is still waiting.
+        tee._queues[1].join()
+        self.assertEqual(fast.getvalue(), "line 0\nline 1\nline 2\nline 3\n")
+        self.assertEqual(slow.getvalue(), "")
+        slow.release.set()
+        tee.flush()
+        self.assertEqual(slow.getvalue(), fast.getvalue())
+        tee.close()
+
+    def test_sink_error(self):
+        for threaded in (False, True):
+            with self.subTest(threaded=threaded):
+                tee = TeeStream([io.StringIO(), FailingSink()], threaded=threaded)
+                tee.write("text")
+                with self.assertRaises(OSError):
+                    tee.close()
+                self.assertTrue(tee.closed)
+                with self.assertRaises(ValueError):
+                    tee.write("more")
+
+    def test_mark(self):
+        r = RstCloth(stream=TeeStream([io.StringIO()]))
+        r.h1("first")
+        self.assertEqual(r.mark(), len("first\n=====\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from rstcloth.utils import first_whitespace_position
+from rstcloth.utils import first_whitespace_position, first_word_fits
 
 
 class TestUtils(unittest.TestCase):
@@ -9,3 +9,21 @@ class TestUtils(unittest.TestCase):
         for string, position in matrix:
             with self.subTest(string=string, position=position):
                 self.assertEqual(first_whitespace_position(string), position)
+
+    def test_first_whitespace_position_unicode(self):
+        for whitespace in ["\u00a0", "\u2003", "\u3000", "\x1c", "\x85", "\u2028"]:
+            with self.subTest(whitespace=whitespace):
+                self.assertEqual(first_whitespace_position("spam" + whitespace + "ham"), 4)
+        self.assertEqual(first_whitespace_position("spam\u200bham"), 8)
+
+    def test_first_whitespace_position_end(self):
+        matrix = (("spam ham", 2, 2), ("spam ham", 5, 4), ("spam", 10, 4), ("spam ham", 0, 0), ("", 3, 0))
+        for string, end, position in matrix:
+            with self.subTest(string=string, end=end):
+                self.assertEqual(first_whitespace_position(string, end), position)
+
+    def test_first_word_fits(self):
+        matrix = (("spam ham", 4, True), ("spam ham", 3, False), ("spam", 4, True), ("", 0, True), ("spam", -1, False))
+        for string, width, fits in matrix:
+            with self.subTest(string=string, width=width):
+                self.assertEqual(first_word_fits(string, width), fits)
@@ -0,0 +1,64 @@
+import random
+import textwrap
+import unittest
+
+from rstcloth.wrapping import LineWrapper, fill, get_wrapper
+
+
+def reference_fill(text, width, initial_indent, subsequent_indent):
+    return textwrap.fill(
+        text=text,
+        width=width,
+        initial_indent=" " * initial_indent,
+        subsequent_indent=" " * subsequent_indent,
+        expand_tabs=False,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+
+
+class TestWrapping(unittest.TestCase):
+    def test_matches_textwrap(self):
+        matrix = (
+            ("", 72, 0, 0),
+            ("   ", 72, 0, 0),
+            ("short text", 72, 0, 0),
+            ("short text ", 72, 3, 3),
+            ("  leading whitespace is kept", 72, 0, 3),
+            ("the " * 100, 72, 0, 0),
+            ("the " * 100, 72, 3, 5),
+            ("tabs\tand\nnewlines\r\nare\x0bspaces", 10, 0, 2),
+            ("v" * 80 + " spam", 72, 0, 3),
+            ("spam " + "v" * 80 + " spam", 72, 3, 3),
+            ("non breaking  ", 8, 0, 0),
+            ("indent wider than width", 4, 6, 6),
+        )
+        for text, width, initial_indent, subsequent_indent in matrix:
+            with self.subTest(text=text, width=width):
+                self.assertEqual(
+                    fill(text, width, initial_indent, subsequent_indent),
+                    reference_fill(text, width, initial_indent, subsequent_indent),
+                )
+
+    def test_matches_textwrap_random(self):
+        generator = random.Random(0)
+        words = ["a", "bb", "ccc", " ", "  ", "\t", "\n", "x" * 30, "-", "\r\n", "\x1c", "\xa0", "\u3000"]
+        for _ in range(2000):
+            text = "".join(generator.choice(words) for _ in range(generator.randint(0, 40)))
+            width, initial_indent, subsequent_indent = generator.randint(1, 40), generator.randint(0, 8), 3
+            self.assertEqual(
+                fill(text, width, initial_indent, subsequent_indent),
+                reference_fill(text, width, initial_indent, subsequent_indent),
+            )
+
+    def test_get_wrapper_is_shared(self):
+        self.assertIs(get_wrapper(72, 3, 3), get_wrapper(72, 3, 3))
+        self.assertIsNot(get_wrapper(72, 3, 3), get_wrapper(72, 0, 3))
+
+    def test_invalid_width(self):
+        with self.assertRaises(ValueError):
+            LineWrapper(0)
+
+
+if __name__ == "__main__":
+    unittest.main()